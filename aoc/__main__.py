@@ -0,0 +1,151 @@
+"""
+Command line entry point.
+
+Usage:
+    python -m aoc run [--day N ...] [--part P ...] [--input PATH] [--json] [--output PATH]
+                      [--parallel [--workers W] [--timeout SECONDS]] [--cache [--cache-dir PATH]]
+                      [--profile [--profile-dir PATH]]
+    python -m aoc bench [--day N ...] [--part P ...] [--sizes S ...] [--repeat R]
+                        [--baseline PATH] [--tolerance T] [--save-baseline PATH]
+"""
+import argparse
+import json
+import os
+import sys
+from typing import List, Optional
+
+from aoc import benchmark, instrument
+from aoc.days import available_days, available_parts
+from aoc.generators import DEFAULT_SIZES, GENERATORS
+from aoc.runner import format_results, run
+from aoc.scheduler import run_parallel
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
+    parser = argparse.ArgumentParser(prog='aoc', description='Run the Advent of Code 2023 solvers.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='run and time solvers')
+    run_parser.add_argument('--day', type=int, action='append', help='day to run (repeatable, default: all)')
+    run_parser.add_argument('--part', type=int, action='append', choices=(1, 2), help='part to run (repeatable, default: all)')
+    run_parser.add_argument('--input', help='input file, only valid with a single --day')
+    run_parser.add_argument('--json', action='store_true', help='print the results as JSON')
+    run_parser.add_argument('--output', help='also write the results as JSON to this file')
+    run_parser.add_argument('--parallel', action='store_true', help='run every day and part in its own worker process')
+    run_parser.add_argument('--workers', type=int, help='number of worker processes with --parallel')
+    run_parser.add_argument('--timeout', type=float, help='maximum running time per job in seconds with --parallel')
+    run_parser.add_argument('--cache', action='store_true', help='load parsed inputs from the parsed-input cache')
+    run_parser.add_argument('--cache-dir', help='parsed-input cache directory (default: $AOC_CACHE_DIR or ~/.cache/aoc)')
+    run_parser.add_argument('--profile', action='store_true', help='record stage statistics, pstats and tracemalloc snapshots')
+    run_parser.add_argument('--profile-dir', help='directory for profiles (default: $AOC_PROFILE_DIR or ./profiles)')
+
+    bench_parser = commands.add_parser('bench', help='benchmark solvers on generated inputs')
+    bench_parser.add_argument('--day', type=int, action='append', help='day to benchmark (repeatable, default: all)')
+    bench_parser.add_argument('--part', type=int, action='append', choices=(1, 2), help='part to benchmark (repeatable, default: all)')
+    bench_parser.add_argument('--sizes', type=int, nargs='+', help='input sizes (default: per-day defaults)')
+    bench_parser.add_argument('--repeat', type=int, default=3, help='timed runs per size, the best is kept')
+    bench_parser.add_argument('--seed', type=int, default=0, help='seed of the input generators')
+    bench_parser.add_argument('--baseline', help='baseline JSON file to compare against')
+    bench_parser.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown over the baseline')
+    bench_parser.add_argument('--save-baseline', help='write the results to this baseline JSON file')
+
+    return parser
+
+def command_run(args: argparse.Namespace, parser: argparse.ArgumentParser) -> None:
+    """Run the selected days and parts and report the results."""
+    days = args.day or available_days()
+    if args.input and len(days) != 1:
+        parser.error('--input requires exactly one --day')
+
+    if (args.workers or args.timeout) and not args.parallel:
+        parser.error('--workers and --timeout require --parallel')
+
+    if args.cache_dir:
+        if not args.cache:
+            parser.error('--cache-dir requires --cache')
+        os.environ['AOC_CACHE_DIR'] = args.cache_dir
+
+    if args.profile_dir and not args.profile:
+        parser.error('--profile-dir requires --profile')
+    if args.profile:
+        os.environ['AOC_PROFILE'] = '1'
+    if args.profile_dir:
+        os.environ['AOC_PROFILE_DIR'] = args.profile_dir
+
+    jobs = []
+    for day in days:
+        try:
+            jobs.extend((day, part) for part in args.part or available_parts(day))
+        except ValueError as error:
+            parser.error(str(error))
+
+    if args.parallel:
+        input_paths = {days[0]: args.input} if args.input else None
+        results = run_parallel(jobs, input_paths, args.timeout, args.workers, args.cache)
+    else:
+        results = []
+        for day, part in jobs:
+            try:
+                results.append(run(day, part, args.input, args.cache))
+            except ValueError as error:
+                parser.error(str(error))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(format_results(results))
+
+        for result in results:
+            if 'stages' in result:
+                print()
+                print(instrument.format_stages(result))
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+def command_bench(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    """Benchmark the selected days and parts, returning 1 if any result regressed."""
+    days = args.day or sorted(GENERATORS)
+
+    results = []
+    for day in days:
+        if day not in GENERATORS:
+            parser.error(f'Day {day} has no input generator')
+
+        sizes = args.sizes or DEFAULT_SIZES[day]
+        for part in args.part or available_parts(day):
+            try:
+                results.extend(benchmark.benchmark(day, part, sizes, args.repeat, args.seed))
+            except ValueError as error:
+                parser.error(str(error))
+
+    baseline = benchmark.load_baseline(args.baseline) if args.baseline else None
+    print(benchmark.format_results(results, baseline))
+
+    if args.save_baseline:
+        benchmark.save_baseline(results, args.save_baseline)
+
+    if baseline is not None:
+        regressions = benchmark.find_regressions(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f'Regression: {regression}', file=sys.stderr)
+
+        if regressions:
+            return 1
+
+    return 0
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        command_run(args, parser)
+    elif args.command == 'bench':
+        return command_bench(args, parser)
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
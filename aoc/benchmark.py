@@ -0,0 +1,106 @@
+"""Benchmark the day solvers on synthetic inputs of increasing size."""
+import json
+import os
+import tempfile
+import tracemalloc
+from typing import Any, Dict, List, Optional, Sequence
+
+from aoc.days import get_solver, load_day
+from aoc.generators import generate
+from aoc.runner import measure
+
+def run_case(day: int, part: int, input_path: str) -> float:
+    """Parse an input and solve one part, returning the wall-clock time in milliseconds."""
+    module = load_day(day)
+    solver = get_solver(day, part)
+
+    data, parse_wall_ms, _ = measure(module.parse_input, input_path)
+    _, solve_wall_ms, _ = measure(solver, data)
+
+    return parse_wall_ms + solve_wall_ms
+
+def benchmark(day: int, part: int, sizes: Sequence[int], repeat: int = 3, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Time a solver and measure its peak memory on generated inputs of each size.
+
+    The wall-clock time is the best of `repeat` runs. Peak memory is measured in a separate
+    run with tracemalloc, so that tracing does not slow down the timed runs.
+
+    Parameters:
+    - day (int): The day number.
+    - part (int): The part number.
+    - sizes (Sequence[int]): The input sizes to generate.
+    - repeat (int): Number of timed runs per size.
+    - seed (int): Seed of the input generator.
+
+    Returns:
+    - List[Dict[str, Any]]: One result per size.
+    """
+    results = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            input_path = os.path.join(directory, f'day{day}_{size}.txt')
+            with open(input_path, 'w') as file:
+                file.write(generate(day, size, seed))
+
+            wall_ms = min(run_case(day, part, input_path) for _ in range(repeat))
+
+            tracemalloc.start()
+            try:
+                run_case(day, part, input_path)
+                _, peak_bytes = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+            results.append({'day': day, 'part': part, 'size': size, 'wall_ms': wall_ms, 'peak_kib': peak_bytes / 1024})
+
+    return results
+
+def get_key(result: Dict[str, Any]) -> str:
+    """Get the baseline key of a benchmark result."""
+    return f'{result["day"]}.{result["part"]}.{result["size"]}'
+
+def load_baseline(file_path: str) -> Dict[str, float]:
+    """Load a baseline, mapping result keys to wall-clock times in milliseconds."""
+    with open(file_path, 'r') as file:
+        return json.load(file)
+
+def save_baseline(results: List[Dict[str, Any]], file_path: str) -> None:
+    """Store the wall-clock times of benchmark results as a baseline."""
+    with open(file_path, 'w') as file:
+        json.dump({get_key(result): result['wall_ms'] for result in results}, file, indent=2)
+
+def find_regressions(results: List[Dict[str, Any]], baseline: Dict[str, float], tolerance: float = 0.25) -> List[str]:
+    """
+    Compare benchmark results with a baseline.
+
+    Parameters:
+    - results (List[Dict[str, Any]]): The benchmark results.
+    - baseline (Dict[str, float]): The baseline wall-clock times.
+    - tolerance (float): Allowed slowdown as a fraction of the baseline time.
+
+    Returns:
+    - List[str]: A description of every result slower than its baseline allows.
+    """
+    regressions = []
+
+    for result in results:
+        key = get_key(result)
+        if key in baseline and result['wall_ms'] > baseline[key] * (1 + tolerance):
+            regressions.append(f'day {result["day"]} part {result["part"]} size {result["size"]}: '
+                               f'{result["wall_ms"]:.3f} ms > {baseline[key]:.3f} ms baseline')
+
+    return regressions
+
+def format_results(results: List[Dict[str, Any]], baseline: Optional[Dict[str, float]] = None) -> str:
+    """Format benchmark results as a table."""
+    lines = [f'{"day":>3} {"part":>4} {"size":>10} {"wall ms":>12} {"peak KiB":>12} {"baseline ms":>12}']
+
+    for result in results:
+        reference = (baseline or {}).get(get_key(result))
+        reference = f'{reference:>12.3f}' if reference is not None else f'{"-":>12}'
+        lines.append(f'{result["day"]:>3} {result["part"]:>4} {result["size"]:>10} '
+                     f'{result["wall_ms"]:>12.3f} {result["peak_kib"]:>12.1f} {reference}')
+
+    return '\n'.join(lines)
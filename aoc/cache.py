@@ -0,0 +1,117 @@
+"""
+Persistent cache of parsed puzzle inputs.
+
+Each entry holds the pickled output of a day's `parse_input`, keyed by the day, the
+day's PARSER_VERSION and the SHA-256 of the input file. Bump PARSER_VERSION in a day
+script whenever the structure returned by its `parse_input` changes. The cache directory
+is kept under a size limit by evicting the least recently used entries.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+import zlib
+from types import ModuleType
+from typing import Any, Optional, Tuple
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'aoc')
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+def get_cache_dir() -> str:
+    """Get the cache directory, which can be set with the AOC_CACHE_DIR environment variable."""
+    return os.environ.get('AOC_CACHE_DIR', DEFAULT_CACHE_DIR)
+
+def get_max_bytes() -> int:
+    """Get the cache size limit, which can be set with the AOC_CACHE_MAX_BYTES environment variable."""
+    return int(os.environ.get('AOC_CACHE_MAX_BYTES', DEFAULT_MAX_BYTES))
+
+def hash_file(file_path: str) -> str:
+    """Compute the SHA-256 hex digest of a file."""
+    digest = hashlib.sha256()
+
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+def get_entry_path(cache_dir: str, day: int, version: int, digest: str) -> str:
+    """Get the path of the cache entry of a parsed input."""
+    return os.path.join(cache_dir, f'day{day}-v{version}-{digest}.pickle.z')
+
+def read_entry(entry_path: str) -> Optional[Any]:
+    """Read a cache entry and mark it as recently used, or return None if it is missing or unreadable."""
+    try:
+        with open(entry_path, 'rb') as file:
+            data = pickle.loads(zlib.decompress(file.read()))
+    except (OSError, zlib.error, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+
+    os.utime(entry_path)
+    return data
+
+def write_entry(entry_path: str, data: Any) -> None:
+    """Write a cache entry atomically."""
+    directory = os.path.dirname(entry_path)
+    os.makedirs(directory, exist_ok=True)
+
+    descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'wb') as file:
+            file.write(zlib.compress(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL), 1))
+        os.replace(temporary_path, entry_path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+def evict(cache_dir: str, max_bytes: int) -> None:
+    """Remove the least recently used entries until the cache fits within max_bytes."""
+    entries = []
+
+    with os.scandir(cache_dir) as scanner:
+        for entry in scanner:
+            if entry.is_file() and entry.name.endswith('.pickle.z'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+    total = sum(size for _, size, _ in entries)
+
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+def load_or_parse(day: int, module: ModuleType, input_path: str, cache_dir: Optional[str] = None) -> Tuple[Any, bool]:
+    """
+    Get the parsed input of a day from the cache, parsing and storing it on a miss.
+
+    Parameters:
+    - day (int): The day number.
+    - module (ModuleType): The day's solver module.
+    - input_path (str): The input file.
+    - cache_dir (Optional[str]): The cache directory, defaults to get_cache_dir().
+
+    Returns:
+    - Tuple[Any, bool]: The parsed input and whether it came from the cache.
+    """
+    cache_dir = cache_dir or get_cache_dir()
+    entry_path = get_entry_path(cache_dir, day, getattr(module, 'PARSER_VERSION', 0), hash_file(input_path))
+
+    data = read_entry(entry_path)
+    if data is not None:
+        return data, True
+
+    data = module.parse_input(input_path)
+
+    try:
+        write_entry(entry_path, data)
+        evict(cache_dir, get_max_bytes())
+    except OSError:
+        pass
+
+    return data, False
@@ -0,0 +1,80 @@
+"""Locate and load the day solver scripts."""
+import importlib.util
+import os
+import sys
+from types import ModuleType
+from typing import Callable, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def get_day_directory(day: int) -> str:
+    """Get the directory holding the solver and inputs of a day."""
+    return os.path.join(REPO_ROOT, f'day {day}')
+
+def get_default_input(day: int) -> str:
+    """Get the path of the puzzle input of a day."""
+    return os.path.join(get_day_directory(day), 'input.txt')
+
+def available_days() -> List[int]:
+    """List the days that have a solver script."""
+    days = []
+
+    for name in os.listdir(REPO_ROOT):
+        prefix, _, number = name.partition(' ')
+        if prefix == 'day' and number.isdigit() and os.path.isfile(os.path.join(REPO_ROOT, name, f'day{number}.py')):
+            days.append(int(number))
+
+    return sorted(days)
+
+def load_day(day: int) -> ModuleType:
+    """
+    Import the solver script of a day as module `dayN`.
+
+    Parameters:
+    - day (int): The day number.
+
+    Returns:
+    - ModuleType: The loaded module.
+    """
+    name = f'day{day}'
+    if name in sys.modules:
+        return sys.modules[name]
+
+    path = os.path.join(get_day_directory(day), f'{name}.py')
+    if not os.path.isfile(path):
+        raise ValueError(f'Day {day} has no solver at {path}')
+
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+
+    # Register before executing so that objects defined by the script can be pickled
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+
+    return module
+
+def available_parts(day: int) -> List[int]:
+    """List the parts a day's solver implements."""
+    module = load_day(day)
+    return [part for part in (1, 2) if hasattr(module, f'part_{part}')]
+
+def get_solver(day: int, part: int) -> Callable:
+    """
+    Get the solver function of a day and part.
+
+    Parameters:
+    - day (int): The day number.
+    - part (int): The part number.
+
+    Returns:
+    - Callable: Function taking the output of the day's `parse_input` and returning the answer.
+    """
+    solver = getattr(load_day(day), f'part_{part}', None)
+    if solver is None:
+        raise ValueError(f'Day {day} has no part {part}')
+
+    return solver
@@ -0,0 +1,136 @@
+"""Synthetic puzzle input generators, one per day, scaled by a size parameter."""
+import random
+from typing import Callable, Dict
+
+NUMBER_WORDS = ('one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine')
+COLORS = ('red', 'green', 'blue')
+SYMBOLS = '*#+$/@=%-&'
+STAGES = ('seed', 'soil', 'fertilizer', 'water', 'light', 'temperature', 'humidity', 'location')
+
+def generate_day_1(size: int, rng: random.Random) -> str:
+    """Generate `size` calibration lines, each holding at least one digit or number word."""
+    lines = []
+
+    for _ in range(size):
+        parts = []
+        for _ in range(rng.randint(1, 5)):
+            parts.append(''.join(rng.choices('abcdfghjklmpqrsuvwxyz', k=rng.randint(0, 4))))
+            parts.append(str(rng.randint(1, 9)) if rng.random() < 0.5 else rng.choice(NUMBER_WORDS))
+        lines.append(''.join(parts))
+
+    return '\n'.join(lines) + '\n'
+
+def generate_day_2(size: int, rng: random.Random) -> str:
+    """Generate `size` games of one to six draws each."""
+    lines = []
+
+    for game_id in range(1, size + 1):
+        draws = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(COLORS, rng.randint(1, 3))
+            draws.append(', '.join(f'{rng.randint(1, 20)} {color}' for color in colors))
+        lines.append(f'Game {game_id}: ' + '; '.join(draws))
+
+    return '\n'.join(lines) + '\n'
+
+def generate_day_3(size: int, rng: random.Random) -> str:
+    """Generate a `size` x `size` schematic of numbers and symbols."""
+    lines = []
+
+    for _ in range(size):
+        row = []
+        while len(row) < size:
+            draw = rng.random()
+            if draw < 0.12:
+                row.extend(str(rng.randint(1, 999)))
+                row.append('.')
+            elif draw < 0.17:
+                row.append(rng.choice(SYMBOLS))
+            else:
+                row.append('.')
+        lines.append(''.join(row[:size]))
+
+    return '\n'.join(lines) + '\n'
+
+def generate_day_4(size: int, rng: random.Random) -> str:
+    """Generate `size` scratchcards with 10 winning and 25 owned numbers."""
+    lines = []
+
+    for card_id in range(1, size + 1):
+        winning = ' '.join(f'{number:>2}' for number in rng.sample(range(1, 100), 10))
+        owned = ' '.join(f'{number:>2}' for number in rng.sample(range(1, 100), 25))
+        lines.append(f'Card {card_id:>3}: {winning} | {owned}')
+
+    return '\n'.join(lines) + '\n'
+
+def generate_day_5(size: int, rng: random.Random) -> str:
+    """Generate an almanac whose seven maps each have `size` ranges."""
+    domain = 2**32
+    seeds = []
+    for _ in range(10):
+        start = rng.randrange(domain // 2)
+        seeds.extend([start, rng.randint(1, domain // 20)])
+
+    blocks = ['seeds: ' + ' '.join(str(seed) for seed in seeds)]
+
+    for source, destination in zip(STAGES, STAGES[1:]):
+        cuts = sorted(rng.sample(range(1, domain), size - 1)) if size > 1 else []
+        bounds = [0] + cuts + [domain]
+        segments = [(bounds[i], bounds[i + 1] - bounds[i]) for i in range(size)]
+
+        order = list(range(size))
+        rng.shuffle(order)
+
+        lines = [f'{source}-to-{destination} map:']
+        destination_start = 0
+        for index in order:
+            source_start, length = segments[index]
+            lines.append(f'{destination_start} {source_start} {length}')
+            destination_start += length
+        blocks.append('\n'.join(lines))
+
+    return '\n\n'.join(blocks) + '\n'
+
+def generate_day_6(size: int, rng: random.Random) -> str:
+    """Generate four races whose times have `size` digits (at least 4, so every race can be won)."""
+    times = [rng.randrange(max(4, 10**(size - 1)), 10**size) for _ in range(4)]
+    distances = [rng.randrange(1, time * time // 4) for time in times]
+
+    return ('Time:      ' + '  '.join(str(time) for time in times) + '\n'
+            'Distance:  ' + '  '.join(str(distance) for distance in distances) + '\n')
+
+GENERATORS: Dict[int, Callable[[int, random.Random], str]] = {
+    1: generate_day_1,
+    2: generate_day_2,
+    3: generate_day_3,
+    4: generate_day_4,
+    5: generate_day_5,
+    6: generate_day_6,
+}
+
+# Sizes used when none are given: lines, games, grid side, cards, ranges per map, digits per race time
+DEFAULT_SIZES: Dict[int, tuple] = {
+    1: (1_000, 10_000, 100_000),
+    2: (1_000, 10_000, 100_000),
+    3: (100, 300, 1_000),
+    4: (1_000, 10_000, 100_000),
+    5: (10, 100, 1_000),
+    6: (2, 8, 32),
+}
+
+def generate(day: int, size: int, seed: int = 0) -> str:
+    """
+    Generate a synthetic input for a day.
+
+    Parameters:
+    - day (int): The day number.
+    - size (int): The scale of the input, see DEFAULT_SIZES for its meaning per day.
+    - seed (int): Seed of the random generator.
+
+    Returns:
+    - str: The contents of the input file.
+    """
+    if day not in GENERATORS:
+        raise ValueError(f'Day {day} has no input generator')
+
+    return GENERATORS[day](size, random.Random(seed))
@@ -0,0 +1,121 @@
+"""
+Opt-in instrumentation of the day solvers.
+
+Enabled by setting the AOC_PROFILE environment variable (or `python -m aoc run --profile`).
+While enabled, the internal stages of a day script are wrapped to count calls, cumulative
+wall-clock time and net traced memory, and every run dumps a cProfile pstats file and a
+tracemalloc snapshot to AOC_PROFILE_DIR (default ./profiles). While disabled, nothing is
+wrapped and the solvers run untouched.
+"""
+import cProfile
+import functools
+import os
+import time
+import tracemalloc
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Tuple
+
+# Internal stages wrapped per day, on top of parse_input, part_1 and part_2
+STAGES: Dict[int, Tuple[str, ...]] = {
+    1: ('read_lines_from_file', 'get_calibration_value', 'to_integer', 'calculate_total'),
+    2: ('read_lines_from_file', 'get_columns', 'get_game_maxima'),
+    3: ('read_lines_from_file', 'load_grid', 'label_numbers', 'dilate', 'get_part_number_sum', 'get_gear_ratio_sum'),
+    4: ('read_lines_from_file', 'get_bitmask', 'parse_card', 'get_match_counts', 'count_cards'),
+    5: ('read_lines_from_file', 'get_data', 'split_range', 'map_ranges', 'compose_maps', 'mapping_batch',
+        'get_complete_map_batch', 'get_lowest_location'),
+    6: ('read_lines_from_file', 'get_races', 'get_kerned_race', 'count_ways_to_win'),
+}
+
+# Stage name -> [calls, cumulative nanoseconds, net traced bytes]
+STATS: Dict[str, List[int]] = {}
+
+def is_enabled() -> bool:
+    """Check whether instrumentation is switched on."""
+    return os.environ.get('AOC_PROFILE', '') not in ('', '0')
+
+def get_profile_dir() -> str:
+    """Get the directory profiles are written to."""
+    return os.environ.get('AOC_PROFILE_DIR', 'profiles')
+
+def wrap(name: str, function: Callable) -> Callable:
+    """Wrap a function so that its calls, time and net traced memory are recorded under `name`."""
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        memory_start = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            stats = STATS.setdefault(name, [0, 0, 0])
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] += tracemalloc.get_traced_memory()[0] - memory_start
+
+    wrapper.instrumented = True
+    return wrapper
+
+def instrument_module(day: int, module: ModuleType) -> None:
+    """
+    Replace the stages of a day module with recording wrappers.
+
+    Functions in the module look each other up as globals at call time, so calls between
+    stages are recorded too. Calling this again on the same module has no effect.
+    """
+    for name in ('parse_input', 'part_1', 'part_2') + STAGES.get(day, ()):
+        function = getattr(module, name, None)
+        if callable(function) and not getattr(function, 'instrumented', False):
+            setattr(module, name, wrap(f'day{day}.{name}', function))
+
+class Session:
+    """A profiling session covering one run of a day and part."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.profiler = cProfile.Profile()
+        self.started_tracing = False
+
+    def start(self) -> None:
+        """Reset the stage statistics and start tracemalloc and cProfile."""
+        STATS.clear()
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+
+        self.profiler.enable()
+
+    def stop(self) -> List[Dict[str, Any]]:
+        """
+        Stop profiling, dump the pstats file and the tracemalloc snapshot, and return the stage statistics.
+
+        Returns:
+        - List[Dict[str, Any]]: Calls, cumulative time and net traced memory per stage,
+          sorted by cumulative time.
+        """
+        self.profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+
+        if self.started_tracing:
+            tracemalloc.stop()
+
+        directory = get_profile_dir()
+        os.makedirs(directory, exist_ok=True)
+        self.profiler.dump_stats(os.path.join(directory, f'{self.name}.pstats'))
+        snapshot.dump(os.path.join(directory, f'{self.name}.tracemalloc'))
+
+        stages = [{'stage': name, 'calls': calls, 'cumulative_ms': total_ns / 1e6, 'net_alloc_kib': net_bytes / 1024}
+                  for name, (calls, total_ns, net_bytes) in STATS.items()]
+
+        return sorted(stages, key=lambda stage: stage['cumulative_ms'], reverse=True)
+
+def format_stages(result: Dict[str, Any]) -> str:
+    """Format the stage statistics of a run result as a table."""
+    lines = [f'day {result["day"]} part {result["part"]}',
+             f'  {"stage":<40} {"calls":>10} {"cumulative ms":>14} {"net alloc KiB":>14}']
+
+    for stage in result['stages']:
+        lines.append(f'  {stage["stage"]:<40} {stage["calls"]:>10} '
+                     f'{stage["cumulative_ms"]:>14.3f} {stage["net_alloc_kib"]:>14.1f}')
+
+    return '\n'.join(lines)
@@ -0,0 +1,96 @@
+"""Run day solvers and measure how long they take."""
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from aoc import cache, instrument
+from aoc.days import get_default_input, get_solver, load_day
+
+def measure(function: Callable, *args: Any) -> Tuple[Any, float, float]:
+    """
+    Call a function and measure its wall-clock and CPU time.
+
+    Parameters:
+    - function (Callable): The function to call.
+    - args (Any): Positional arguments for the function.
+
+    Returns:
+    - Tuple[Any, float, float]: The return value, the wall-clock time and the CPU time in milliseconds.
+    """
+    wall_start = time.perf_counter_ns()
+    cpu_start = time.process_time_ns()
+
+    result = function(*args)
+
+    cpu_ms = (time.process_time_ns() - cpu_start) / 1e6
+    wall_ms = (time.perf_counter_ns() - wall_start) / 1e6
+
+    return result, wall_ms, cpu_ms
+
+def run(day: int, part: int, input_path: Optional[str] = None, use_cache: bool = False) -> Dict[str, Any]:
+    """
+    Parse the input of a day and solve one part, timing both steps.
+
+    Parameters:
+    - day (int): The day number.
+    - part (int): The part number.
+    - input_path (Optional[str]): The input file, defaults to the day's input.txt.
+    - use_cache (bool): Load the parsed input from the parsed-input cache when possible.
+
+    Returns:
+    - Dict[str, Any]: The answer, whether the parsed input came from the cache, and the parse,
+      solve and total timings in milliseconds. With instrumentation enabled, also the
+      statistics of every stage.
+    """
+    module = load_day(day)
+    solver = get_solver(day, part)
+    input_path = input_path or get_default_input(day)
+
+    session = None
+    if instrument.is_enabled():
+        instrument.instrument_module(day, module)
+        solver = get_solver(day, part)
+        session = instrument.Session(f'day{day}-part{part}')
+        session.start()
+
+    try:
+        if use_cache:
+            (data, cached), parse_wall_ms, parse_cpu_ms = measure(cache.load_or_parse, day, module, input_path)
+        else:
+            data, parse_wall_ms, parse_cpu_ms = measure(module.parse_input, input_path)
+            cached = False
+
+        answer, solve_wall_ms, solve_cpu_ms = measure(solver, data)
+    finally:
+        stages = session.stop() if session is not None else None
+
+    result = {'day': day,
+              'part': part,
+              'input': input_path,
+              'answer': int(answer),
+              'cached': cached,
+              'parse_wall_ms': parse_wall_ms,
+              'parse_cpu_ms': parse_cpu_ms,
+              'solve_wall_ms': solve_wall_ms,
+              'solve_cpu_ms': solve_cpu_ms,
+              'wall_ms': parse_wall_ms + solve_wall_ms,
+              'cpu_ms': parse_cpu_ms + solve_cpu_ms}
+
+    if stages is not None:
+        result['stages'] = stages
+
+    return result
+
+def format_results(results: List[Dict[str, Any]]) -> str:
+    """Format run results as a table."""
+    lines = [f'{"day":>3} {"part":>4} {"answer":>20} {"parse ms":>10} {"solve ms":>10} {"wall ms":>10} {"cpu ms":>10}']
+
+    for result in results:
+        if result.get('status', 'ok') != 'ok':
+            lines.append(f'{result["day"]:>3} {result["part"]:>4} {result["status"]:>20} {result["error"]}')
+            continue
+
+        lines.append(f'{result["day"]:>3} {result["part"]:>4} {result["answer"]:>20} '
+                     f'{result["parse_wall_ms"]:>10.3f} {result["solve_wall_ms"]:>10.3f} '
+                     f'{result["wall_ms"]:>10.3f} {result["cpu_ms"]:>10.3f}')
+
+    return '\n'.join(lines)
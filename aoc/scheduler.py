@@ -0,0 +1,105 @@
+"""Run many (day, part) jobs in parallel on a process pool."""
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from aoc.runner import run
+
+# How often the scheduler checks running jobs against their timeout, in seconds
+POLL_INTERVAL = 0.05
+
+def run_job(day: int, part: int, input_path: Optional[str], use_cache: bool) -> Dict[str, Any]:
+    """Run a single job inside a worker process."""
+    result = run(day, part, input_path, use_cache)
+    result['status'] = 'ok'
+    return result
+
+def get_failed_result(day: int, part: int, input_path: Optional[str], status: str, error: str) -> Dict[str, Any]:
+    """Build the result of a job that did not produce an answer."""
+    return {'day': day, 'part': part, 'input': input_path, 'answer': None, 'status': status, 'error': error}
+
+def terminate_workers(executor: ProcessPoolExecutor) -> None:
+    """Kill the worker processes of an executor, so that jobs stuck past their timeout stop."""
+    # ProcessPoolExecutor has no public way to stop a running call
+    for process in list((getattr(executor, '_processes', None) or {}).values()):
+        process.terminate()
+
+    executor.shutdown(wait=False, cancel_futures=True)
+
+def run_parallel(jobs: List[Tuple[int, int]], input_paths: Optional[Dict[int, str]] = None,
+                 timeout: Optional[float] = None, workers: Optional[int] = None,
+                 use_cache: bool = False) -> List[Dict[str, Any]]:
+    """
+    Run (day, part) jobs on a process pool and collect their results.
+
+    Each job is timed by the runner inside its worker. At most one job per free worker is
+    submitted at a time, so a job starts running as soon as it is submitted and its timeout
+    is counted from then. A job that has been running for longer than `timeout` seconds is
+    reported as timed out and keeps its worker occupied until it finishes, in which case its
+    result is discarded; if every worker is stuck that way, the pool is killed and replaced,
+    and otherwise the workers are killed once every other job has finished. With `use_cache`, workers share parsed inputs through the on-disk
+    parsed-input cache.
+
+    Parameters:
+    - jobs (List[Tuple[int, int]]): The (day, part) pairs to run.
+    - input_paths (Optional[Dict[int, str]]): Input file per day, defaults to each day's input.txt.
+    - timeout (Optional[float]): Maximum running time per job in seconds.
+    - workers (Optional[int]): Number of worker processes, defaults to one per job.
+    - use_cache (bool): Load parsed inputs from the parsed-input cache when possible.
+
+    Returns:
+    - List[Dict[str, Any]]: One result per job, in the order of `jobs`, with a 'status' of
+      'ok', 'timeout' or 'error'.
+    """
+    input_paths = input_paths or {}
+    workers = workers or max(1, len(jobs))
+    results: Dict[Tuple[int, int], Dict[str, Any]] = {}
+    queued = list(reversed(jobs))
+    executor = ProcessPoolExecutor(max_workers=workers)
+
+    pending: Dict[Future, Tuple[int, int]] = {}
+    started: Dict[Future, float] = {}
+    overdue: Set[Future] = set()
+
+    try:
+        while pending or queued:
+            if queued and len(overdue) == workers:
+                terminate_workers(executor)
+                executor = ProcessPoolExecutor(max_workers=workers)
+                overdue.clear()
+
+            while queued and len(pending) + len(overdue) < workers:
+                day, part = queued.pop()
+                future = executor.submit(run_job, day, part, input_paths.get(day), use_cache)
+                pending[future] = (day, part)
+                started[future] = time.perf_counter()
+
+            done, _ = wait(set(pending) | overdue, timeout=POLL_INTERVAL, return_when=FIRST_COMPLETED)
+            now = time.perf_counter()
+
+            for future in done:
+                if future in overdue:
+                    # Already reported as timed out, but its worker is free again
+                    overdue.discard(future)
+                    continue
+
+                day, part = pending.pop(future)
+                try:
+                    results[(day, part)] = future.result()
+                except Exception as error:
+                    results[(day, part)] = get_failed_result(day, part, input_paths.get(day), 'error', repr(error))
+
+            if timeout is not None:
+                for future, (day, part) in list(pending.items()):
+                    if now - started[future] > timeout:
+                        del pending[future]
+                        overdue.add(future)
+                        results[(day, part)] = get_failed_result(day, part, input_paths.get(day), 'timeout',
+                                                                 f'still running after {timeout} s')
+    finally:
+        if overdue:
+            terminate_workers(executor)
+        else:
+            executor.shutdown()
+
+    return [results[job] for job in jobs]
@@ -1,42 +1,74 @@
+import hashlib
+import json
+import mmap
 import os
+import re
 import sys
-from typing import List, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+# Define mapping of word representations to integer values
+string_to_int_mapping = {'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5, 'six': 6, 'seven': 7, 'eight': 8, 'nine': 9}
+
+# Match a digit or a number word, scanning forward and over the reversed line respectively
+FORWARD_PATTERN = re.compile('|'.join([r'\d'] + list(string_to_int_mapping)))
+BACKWARD_PATTERN = re.compile('|'.join([r'\d'] + [word[::-1] for word in string_to_int_mapping]))
+
+# Target size in bytes of the chunks summed by each worker in parallel mode
+CHUNK_SIZE = 16 * 1024 * 1024
+
+PARSER_VERSION = 1
 
 def read_lines_from_file(file_path: str) -> List[str]:
     """Read lines from a file and return a list of strings."""
     with open(file_path, 'r') as file:
         return [line.strip() for line in file.readlines()]
 
-def get_integers_and_index(line: str) -> List[Tuple[int, Union[str, int]]]:
+def to_integer(match: str) -> int:
+    """Convert a matched digit or number word (in either direction) to its integer value."""
+    if match.isdigit():
+        return int(match)
+
+    return string_to_int_mapping.get(match) or string_to_int_mapping[match[::-1]]
+
+def get_calibration_value(line: str) -> int:
     """
-    Extract integers and their indices from a given string.
+    Get the calibration value of a line from its first and last digit or number word.
+
+    The first match is found scanning forward and the last scanning the reversed line,
+    so overlapping words such as "twone" resolve correctly.
 
     Args:
         line (str): Input string.
 
     Returns:
-        List[Tuple[int, Union[str, int]]]: List of tuples containing index and integer representation.
+        int: Calibration value.
     """
-    result = []
+    first_integer = to_integer(FORWARD_PATTERN.search(line).group())
+    last_integer = to_integer(BACKWARD_PATTERN.search(line[::-1]).group())
 
-    # Extract numeric digits
-    for index, element in enumerate(line):
-        if element.isdigit():
-            result.append((index, int(element)))
+    return 10 * first_integer + last_integer
 
-    # Extract words representing numbers
-    for integer_word, integer_str in string_to_int_mapping.items():
-        index = line.find(integer_word)
+def calculate_total(lines: List[str]) -> int:
+    """
+    Calculate the total sum of integers extracted from a list of strings.
 
-        while index != -1:
-            result.append((index, int(integer_str)))
-            index = line.find(integer_word, index + 1)
+    Args:
+        lines (List[str]): List of input strings.
 
-    return result
+    Returns:
+        int: Total sum of integers.
+    """
+    return sum(get_calibration_value(line) for line in lines)
 
-def calculate_total(lines: List[str]) -> int:
+def parse_input(file_path: str) -> List[str]:
+    """Read and parse the input file."""
+    return read_lines_from_file(file_path)
+
+def part_2(lines: List[str]) -> int:
     """
-    Calculate the total sum of integers extracted from a list of strings.
+    Solution for part 2: the total calibration value, counting number words as digits.
 
     Args:
         lines (List[str]): List of input strings.
@@ -44,33 +76,163 @@ def calculate_total(lines: List[str]) -> int:
     Returns:
         int: Total sum of integers.
     """
-    total_sum = 0
+    return calculate_total(lines)
+
+def get_chunk_bounds(data: mmap.mmap, chunk_size: int) -> List[Tuple[int, int]]:
+    """
+    Split a file into byte ranges of roughly chunk_size bytes that end on a line boundary.
+
+    Args:
+        data (mmap.mmap): Memory map of the file.
+        chunk_size (int): Target size of each chunk in bytes.
 
-    for line in lines:
-        indices_and_integers = get_integers_and_index(line)
-        sorted_indices_and_integers = sorted(indices_and_integers, key=lambda x: x[0])
+    Returns:
+        List[Tuple[int, int]]: List of (start, end) byte offsets.
+    """
+    bounds = []
+    start = 0
+    size = len(data)
 
-        # Retrieve the first and last integers from the sorted list
-        first_integer = sorted_indices_and_integers[0][1]
-        last_integer = sorted_indices_and_integers[-1][1]
+    while start < size:
+        end = min(size, start + chunk_size)
 
-        # Convert word representations to actual integers using the mapping
-        if isinstance(first_integer, str):
-            first_integer = string_to_int_mapping[first_integer]
+        if end < size:
+            newline_index = data.find(b'\n', end - 1)
+            end = size if newline_index == -1 else newline_index + 1
 
-        if isinstance(last_integer, str):
-            last_integer = string_to_int_mapping[last_integer]
+        bounds.append((start, end))
+        start = end
 
-        # Calculate the value and add to the total sum
-        value = int(str(first_integer) + str(last_integer))
-        total_sum += value
+    return bounds
 
-    return total_sum
+def calculate_chunk_total(file_path: str, start: int, end: int) -> int:
+    """
+    Calculate the total of the lines within a byte range of a file.
 
-if __name__ == "__main__":
-    # Define mapping of word representations to integer values
-    string_to_int_mapping = {'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5, 'six': 6, 'seven': 7, 'eight': 8, 'nine': 9}
+    Args:
+        file_path (str): Path to the input file.
+        start (int): Offset of the first byte of the chunk.
+        end (int): Offset one past the last byte of the chunk.
 
+    Returns:
+        int: Total sum of integers in the chunk.
+    """
+    with open(file_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        lines = data[start:end].decode().split('\n')
+
+    return calculate_total([line.strip() for line in lines if line.strip()])
+
+def calculate_total_parallel(file_path: str, workers: Optional[int] = None, chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Calculate the total sum of integers of a file, summing line-aligned chunks in parallel.
+
+    Args:
+        file_path (str): Path to the input file.
+        workers (Optional[int]): Number of worker processes, defaults to the number of CPUs.
+        chunk_size (int): Target size of each chunk in bytes.
+
+    Returns:
+        int: Total sum of integers.
+    """
+    if os.path.getsize(file_path) == 0:
+        return 0
+
+    with open(file_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        bounds = get_chunk_bounds(data, chunk_size)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        starts, ends = zip(*bounds)
+        return sum(executor.map(calculate_chunk_total, repeat(file_path), starts, ends))
+
+def hash_prefix(file: BinaryIO, offset: int) -> Any:
+    """Hash the first `offset` bytes of a file, returning the SHA-256 object so it can be extended."""
+    digest = hashlib.sha256()
+    file.seek(0)
+
+    remaining = offset
+    while remaining > 0:
+        block = file.read(min(remaining, 1024 * 1024))
+        if not block:
+            break
+        digest.update(block)
+        remaining -= len(block)
+
+    return digest
+
+def read_checkpoint(checkpoint_path: str) -> Optional[Dict[str, Any]]:
+    """Read a checkpoint file, or return None if it is missing or unreadable."""
+    try:
+        with open(checkpoint_path, 'r') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+def write_checkpoint(checkpoint_path: str, checkpoint: Dict[str, Any]) -> None:
+    """Write a checkpoint file atomically."""
+    temporary_path = checkpoint_path + '.tmp'
+    with open(temporary_path, 'w') as file:
+        json.dump(checkpoint, file)
+
+    os.replace(temporary_path, checkpoint_path)
+
+def calculate_total_incremental(file_path: str, checkpoint_path: Optional[str] = None) -> int:
+    """
+    Calculate the total sum of integers of a growing file, only scanning what was appended since the last run.
+
+    The checkpoint stores the offset after the last complete line that was summed, the total up
+    to there, the file's device and inode, and a SHA-256 of every byte before the offset. Each
+    run re-hashes that prefix, which is much cheaper than parsing it; if the file was replaced,
+    truncated or rewritten anywhere before the offset, the whole file is scanned again. A
+    trailing line without a newline is counted in the returned total but not in the checkpoint,
+    since it may still be being written; if it has no digit or number word yet, it counts as 0.
+
+    Args:
+        file_path (str): Path to the input file.
+        checkpoint_path (Optional[str]): Path to the checkpoint file, defaults to the input path
+            with '.checkpoint.json' appended.
+
+    Returns:
+        int: Total sum of integers.
+    """
+    checkpoint_path = checkpoint_path or file_path + '.checkpoint.json'
+    checkpoint = read_checkpoint(checkpoint_path)
+
+    with open(file_path, 'rb') as file:
+        stat = os.fstat(file.fileno())
+        offset, total = 0, 0
+        digest = hashlib.sha256()
+
+        if (checkpoint is not None
+                and checkpoint.get('device') == stat.st_dev
+                and checkpoint.get('inode') == stat.st_ino
+                and 0 <= checkpoint.get('offset', -1) <= stat.st_size):
+            prefix_digest = hash_prefix(file, checkpoint['offset'])
+
+            if prefix_digest.hexdigest() == checkpoint.get('prefix_sha256'):
+                offset, total, digest = checkpoint['offset'], checkpoint['total'], prefix_digest
+
+        file.seek(offset)
+        partial_value = 0
+
+        for raw_line in file:
+            line = raw_line.decode().strip()
+
+            if not raw_line.endswith(b'\n'):
+                # A half-written line may not contain a digit or number word yet
+                if FORWARD_PATTERN.search(line):
+                    partial_value = get_calibration_value(line)
+                break
+
+            total += get_calibration_value(line) if line else 0
+            offset += len(raw_line)
+            digest.update(raw_line)
+
+    write_checkpoint(checkpoint_path, {'offset': offset, 'total': total, 'device': stat.st_dev,
+                                       'inode': stat.st_ino, 'prefix_sha256': digest.hexdigest()})
+
+    return total + partial_value
+
+if __name__ == "__main__":
     # Construct file path relative to the script location
     file_path = os.path.join(sys.path[0], 'input.txt')
 
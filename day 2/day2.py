@@ -1,144 +1,211 @@
 import os
 import sys
-from typing import List, Dict
+from array import array
+from typing import Iterator, List, Tuple
+
+import numpy as np
+
+COLORS = ('red', 'green', 'blue')
+PARSER_VERSION = 1
 
 def read_lines_from_file(file_path: str) -> List[str]:
     """Read lines from a file and return a list of strings."""
     with open(file_path, 'r') as file:
         return [line.strip() for line in file.readlines()]
 
-def get_info(lines: List[str]) -> Dict[int, List[Dict[str, int]]]:
+def get_columns(lines: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """
-    Parse the input lines to extract information about games and their attributes.
+    Parse the input lines into flat columns with one row per draw.
 
     Args:
     - lines (List[str]): List of strings containing information about games.
 
     Returns:
-    - Dict[int, List[Dict[str, int]]]: A dictionary where the key is the game ID and the value
-      is a list of dictionaries representing each game's attributes.
+    - Tuple[np.ndarray, ...]: int64 arrays of game ID, draw index and the number of red, green
+      and blue cubes in the draw. Colours that are not drawn count as 0.
     """
-    info = {}
+    columns = {name: array('q') for name in ('game_id', 'draw_index') + COLORS}
+
     for line in lines:
-        # Split the line into ID part and information part
         id_part, info_part = line.split(': ')
         game_id = int(id_part.split(' ')[1])
 
-        # Split the information part into individual games
-        games = info_part.split('; ')
-
-        games_arr = []
-        for game in games:
-            game_info = {}
-            # Extract values and colors for each attribute in a game
+        for draw_index, game in enumerate(info_part.split('; ')):
+            counts = dict.fromkeys(COLORS, 0)
             for item in game.split(', '):
                 value, color = item.split(' ')
-                game_info[color] = int(value)
+                counts[color] = int(value)
 
-            games_arr.append(game_info)
+            columns['game_id'].append(game_id)
+            columns['draw_index'].append(draw_index)
+            for color in COLORS:
+                columns[color].append(counts[color])
 
-        info[game_id] = games_arr
+    return tuple(np.frombuffer(column, dtype=np.int64) for column in columns.values())
 
-    return info
-
-def is_game_possible(game: List[Dict[str, int]], red_max: int, green_max: int, blue_max: int) -> bool:
+def get_game_maxima(game_ids: np.ndarray, red: np.ndarray, green: np.ndarray, blue: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Check if a given game is possible based on the maximum allowed values for each color.
+    Get the maximum number of cubes of each colour drawn in every game.
 
     Args:
-    - game (List[Dict[str, int]]): List of dictionaries representing the attributes of the game.
-    - red_max (int): Maximum allowed value for the 'red' color.
-    - green_max (int): Maximum allowed value for the 'green' color.
-    - blue_max (int): Maximum allowed value for the 'blue' color.
+    - game_ids (np.ndarray): Game ID of every draw, with the draws of a game next to each other.
+    - red (np.ndarray): Number of red cubes in every draw.
+    - green (np.ndarray): Number of green cubes in every draw.
+    - blue (np.ndarray): Number of blue cubes in every draw.
 
     Returns:
-    - bool: True if the game is possible within the specified limits, False otherwise.
+    - Tuple[np.ndarray, np.ndarray]: The ID of every game and an (n_games, 3) array of its
+      red, green and blue maxima.
     """
-    for item in game:
-        if 'red' in item and item['red'] > red_max:
-            return False
+    if len(game_ids) == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros((0, 3), dtype=np.int64)
 
-        if 'green' in item and item['green'] > green_max:
-            return False
+    starts = np.flatnonzero(np.r_[True, game_ids[1:] != game_ids[:-1]])
+    maxima = np.maximum.reduceat(np.stack([red, green, blue], axis=1), starts, axis=0)
 
-        if 'blue' in item and item['blue'] > blue_max:
-            return False
+    return game_ids[starts], maxima
 
-    return True
+def parse_input(file_path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Read and parse the input file into a table of per-game colour maxima.
+
+    Args:
+    - file_path (str): The path to the input file.
+
+    Returns:
+    - Tuple[np.ndarray, np.ndarray]: The ID of every game and its red, green and blue maxima.
+    """
+    game_ids, _, red, green, blue = get_columns(read_lines_from_file(file_path))
+    return get_game_maxima(game_ids, red, green, blue)
 
-def get_minimum_set_of_cubes(game: List[Dict[str, int]]) -> List[int]:
+def build_limit_index(games: Tuple[np.ndarray, np.ndarray]) -> Tuple[Tuple[np.ndarray, ...], np.ndarray]:
     """
-    Get the minimum set of cubes required for a game.
+    Build an index answering "sum of the IDs of the games possible under limits (r, g, b)".
+
+    Every colour axis is compressed to the distinct maxima that occur, and a 3D prefix sum
+    over the compressed grid holds, for every cell, the sum of the IDs of the games whose
+    maxima are all at or below it. Memory is the product of the distinct counts per colour.
 
     Args:
-    - game (List[Dict[str, int]]): List of dictionaries representing the attributes of the game.
+    - games (Tuple[np.ndarray, np.ndarray]): The ID of every game and its red, green and blue maxima.
 
     Returns:
-    - List[int]: List of the maximum values for each color in the game.
-    """
-    red_values = []
-    green_values = []
-    blue_values = []
-    for item in game:
-        if 'red' in item:
-            red_values.append(item['red'])
-        if 'green' in item:
-            green_values.append(item['green'])
-        if 'blue' in item:
-            blue_values.append(item['blue'])
-        
-    minimum_set_of_cubes = [max(red_values), max(green_values), max(blue_values)]
-    
-    return minimum_set_of_cubes
-    
-def get_power_of_minimum_set(minimum_set_of_cubes: List[int]) -> int:
+    - Tuple[Tuple[np.ndarray, ...], np.ndarray]: The sorted distinct maxima per colour and the prefix sums.
+    """
+    game_ids, maxima = games
+    axes = tuple(np.unique(maxima[:, color]) for color in range(3))
+    coordinates = tuple(np.searchsorted(axes[color], maxima[:, color]) + 1 for color in range(3))
+
+    sums = np.zeros(tuple(len(axis) + 1 for axis in axes), dtype=np.int64)
+    np.add.at(sums, coordinates, game_ids)
+
+    return axes, sums.cumsum(axis=0).cumsum(axis=1).cumsum(axis=2)
+
+def query_limit_index(index: Tuple[Tuple[np.ndarray, ...], np.ndarray], limits: np.ndarray) -> np.ndarray:
     """
-    Calculate the power of the minimum set of cubes.
+    Answer a batch of bag-limit queries with a limit index.
 
     Args:
-    - minimum_set_of_cubes (List[int]): List of the maximum values for each color.
+    - index (Tuple[Tuple[np.ndarray, ...], np.ndarray]): The index built by build_limit_index.
+    - limits (np.ndarray): An (n, 3) array of red, green and blue limits.
 
     Returns:
-    - int: The product of the values in the minimum_set_of_cubes.
+    - np.ndarray: For every limit triple, the sum of the IDs of the games possible under it.
     """
-    return minimum_set_of_cubes[0] * minimum_set_of_cubes[1] * minimum_set_of_cubes[2]
+    axes, sums = index
+    limits = np.asarray(limits, dtype=np.int64).reshape(-1, 3)
+    coordinates = tuple(np.searchsorted(axes[color], limits[:, color], side='right') for color in range(3))
 
-def part_1():
-    # Construct file path relative to the script location
-    file_path = os.path.join(sys.path[0], 'input.txt')
+    return sums[coordinates]
 
-    # Read lines from the file
-    lines = read_lines_from_file(file_path)
-    info = get_info(lines)
+def part_1(games: Tuple[np.ndarray, np.ndarray]) -> int:
+    """Solution for part 1: the sum of the IDs of the games possible with 12 red, 13 green and 14 blue cubes."""
+    game_ids, maxima = games
     
     red_max, green_max, blue_max = 12, 13, 14
     
-    count = 0
-    arr = []
-    for game_id, game in info.items():
-        if is_game_possible(game, red_max, green_max, blue_max):
-            count += game_id
-            arr.append(game_id)
+    possible = (maxima <= np.array([red_max, green_max, blue_max])).all(axis=1)
                 
-    print(f'Answer part 1: {sum(list(set(arr)))}')
+    return int(game_ids[possible].sum())
+    
+def part_2(games: Tuple[np.ndarray, np.ndarray]) -> int:
+    """Solution for part 2: the sum of the powers of the minimum sets of cubes."""
+    _, maxima = games
     
-def part_2():
+    return int(maxima.prod(axis=1).sum())
+
+def get_line_maxima(line: str) -> Tuple[int, int, int, int]:
+    """
+    Parse a single game line into its ID and the maximum number of cubes drawn of each colour.
+
+    Args:
+    - line (str): String containing information about one game.
+
+    Returns:
+    - Tuple[int, int, int, int]: The game ID and the red, green and blue maxima.
+    """
+    id_part, info_part = line.split(': ')
+    maxima = dict.fromkeys(COLORS, 0)
+
+    for game in info_part.split('; '):
+        for item in game.split(', '):
+            value, color = item.split(' ')
+            maxima[color] = max(maxima[color], int(value))
+
+    return int(id_part.split(' ')[1]), maxima['red'], maxima['green'], maxima['blue']
+
+def stream_game_results(file_path: str, red_max: int, green_max: int, blue_max: int) -> Iterator[Tuple[int, int]]:
+    """
+    Read games line by line and yield their contributions to both answers.
+
+    Args:
+    - file_path (str): The path to the input file.
+    - red_max (int): Maximum allowed value for the 'red' color.
+    - green_max (int): Maximum allowed value for the 'green' color.
+    - blue_max (int): Maximum allowed value for the 'blue' color.
+
+    Returns:
+    - Iterator[Tuple[int, int]]: For every game, its ID if it is possible (0 otherwise) and
+      the power of its minimum set of cubes.
+    """
+    with open(file_path, 'r') as file:
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+
+            game_id, red, green, blue = get_line_maxima(line)
+            possible = red <= red_max and green <= green_max and blue <= blue_max
+
+            yield (game_id if possible else 0), red * green * blue
+
+def solve(file_path: str, red_max: int = 12, green_max: int = 13, blue_max: int = 14) -> Tuple[int, int]:
+    """
+    Compute the answers of both parts in a single pass over the input file.
+
+    Args:
+    - file_path (str): The path to the input file.
+    - red_max (int): Maximum allowed value for the 'red' color.
+    - green_max (int): Maximum allowed value for the 'green' color.
+    - blue_max (int): Maximum allowed value for the 'blue' color.
+
+    Returns:
+    - Tuple[int, int]: The answers of part 1 and part 2.
+    """
+    answer_1 = 0
+    answer_2 = 0
+
+    for id_contribution, power in stream_game_results(file_path, red_max, green_max, blue_max):
+        answer_1 += id_contribution
+        answer_2 += power
+
+    return answer_1, answer_2
+
+if __name__ == "__main__":
     # Construct file path relative to the script location
     file_path = os.path.join(sys.path[0], 'input.txt')
 
-    # Read lines from the file
-    lines = read_lines_from_file(file_path)
-    info = get_info(lines)
-    
-    count = 0
-    for _, game in info.items():
-        minimum_set_of_cubes = get_minimum_set_of_cubes(game)
-        power_of_minimum_set = get_power_of_minimum_set(minimum_set_of_cubes)
-        
-        count += power_of_minimum_set
-        
-    print(f'Answer part 2: {count}')
+    answer_1, answer_2 = solve(file_path)
 
-if __name__ == "__main__":
-    part_1()
-    part_2()
\ No newline at end of file
+    print(f'Answer part 1: {answer_1}')
+    print(f'Answer part 2: {answer_2}')
@@ -1,8 +1,14 @@
 import os
+import re
 import sys
-from typing import List, Tuple
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Set, Tuple
 import numpy as np
 
+NUMBER_PATTERN = re.compile(r'\d+')
+SYMBOL_PATTERN = re.compile(r'[^\d.]')
+PARSER_VERSION = 1
+
 def read_lines_from_file(file_path: str) -> List[str]:
     """Read lines from a file and return a list of strings."""
     with open(file_path, 'r') as file:
@@ -10,20 +16,15 @@ def read_lines_from_file(file_path: str) -> List[str]:
 
 def get_surrounding_indices(grid: List[List[str]], row: int, col: int) -> List[Tuple[int, int]]:
     """Get surrounding indices for a given position in a 2D grid."""
-    n = len(grid)
-    surrounding_indices = [(i, j) for i in range(max(0, row - 1), min(n, row + 2))
-                            for j in range(max(0, col - 1), min(n, col + 2))
+    surrounding_indices = [(i, j) for i in range(max(0, row - 1), min(len(grid), row + 2))
+                            for j in range(max(0, col - 1), min(len(grid[i]), col + 2))
                             if i != row or j != col]
     return surrounding_indices
 
-def split_string(input_string: str) -> List[str]:
-    """Split a string based on non-digit characters and filter out empty strings."""
-    result = [item for item in input_string if item.isdigit()]
-    return result
-
-def get_numbers_and_indices(lines: List[str], integers: List[str]) -> List[dict]:
-    """Extract numbers and their indices from the lines."""
+def get_numbers_and_indices(lines: List[str], integers: Set[str]) -> Tuple[List[dict], Dict[Tuple[int, int], int]]:
+    """Extract numbers and their indices from the lines, plus an index from cell to number id."""
     numbers = []
+    cell_index = {}
 
     for height_index, line in enumerate(lines):
         i = 0
@@ -34,83 +35,192 @@ def get_numbers_and_indices(lines: List[str], integers: List[str]) -> List[dict]
                     i += 1
 
                 ending_index = i
-                numbers.append({'number': line[starting_index:ending_index],
+                number_id = len(numbers)
+                numbers.append({'id': number_id,
+                                'number': line[starting_index:ending_index],
                                 'indices': [(height_index, index) for index in range(starting_index, ending_index)]})
+
+                for index in range(starting_index, ending_index):
+                    cell_index[(height_index, index)] = number_id
             else:
                 i += 1
 
-    return numbers
+    return numbers, cell_index
 
-def remove_duplicates(arr: List[dict]) -> List[dict]:
-    """Remove duplicate dictionaries from a list."""
-    seen = set()
-    result = []
+def get_adjacent_number_ids(cell_index: Dict[Tuple[int, int], int], indices: List[Tuple[int, int]]) -> Set[int]:
+    """Get the ids of the numbers occupying any of the given cells."""
+    return {cell_index[index] for index in indices if index in cell_index}
 
-    def tuple_from_dict(d):
-        return tuple((k, tuple(v) if isinstance(v, list) else v) for k, v in sorted(d.items()))
+def get_part_number_sum_indexed(lines: List[str]) -> int:
+    """Sum the numbers adjacent to at least one symbol, using the cell index (reference for get_part_number_sum)."""
+    integers = set(str(i) for i in range(10))
+    numbers_and_indices, cell_index = get_numbers_and_indices(lines, integers)
 
-    for d in arr:
-        tuple_representation = tuple_from_dict(d)
+    number_ids = set()
 
-        if tuple_representation not in seen:
-            seen.add(tuple_representation)
-            result.append(d)
-
-    return result
+    for height_index, line in enumerate(lines):
+        for width_index, item in enumerate(line):
+            if item not in integers and item != '.':
+                indices = get_surrounding_indices(lines, row=height_index, col=width_index)
+                number_ids |= get_adjacent_number_ids(cell_index, indices)
 
-def part_1():
-    """Solution for part 1."""
-    file_path = os.path.join(sys.path[0], 'input.txt')
-    lines = read_lines_from_file(file_path)
+    return sum(int(numbers_and_indices[number_id]['number']) for number_id in number_ids)
 
-    integers = [str(i) for i in range(10)]
-    numbers_and_indices = get_numbers_and_indices(lines, integers)
+def get_gear_ratio_sum_indexed(lines: List[str]) -> int:
+    """Sum the gear ratios, using the cell index (reference for get_gear_ratio_sum)."""
+    integers = set(str(i) for i in range(10))
+    numbers_and_indices, cell_index = get_numbers_and_indices(lines, integers)
 
-    numbers_adjacent = []
+    answer = 0
 
     for height_index, line in enumerate(lines):
         for width_index, item in enumerate(line):
-            if item not in integers and item != '.':
+            if item == '*':
                 indices = get_surrounding_indices(lines, row=height_index, col=width_index)
+                number_ids = get_adjacent_number_ids(cell_index, indices)
 
-                for index in indices:
-                    for item in numbers_and_indices:
-                        indices_number = item['indices']
-                        if index in indices_number:
-                            numbers_adjacent.append(item)
+                if len(number_ids) == 2:
+                    first_id, second_id = number_ids
+                    answer += int(numbers_and_indices[first_id]['number']) * int(numbers_and_indices[second_id]['number'])
 
-    numbers_final = remove_duplicates(numbers_adjacent)
+    return answer
 
-    final = [item['number'] for item in numbers_final]
-    answer = sum(int(item) for item in final)
-    print(f'Answer part 1: {answer}')
+def load_grid(lines: List[str]) -> np.ndarray:
+    """Load the schematic into a 2D uint8 array of character codes, padding short rows with '.'."""
+    width = max((len(line) for line in lines), default=0)
+    data = ''.join(line.ljust(width, '.') for line in lines).encode('ascii')
+    return np.frombuffer(data, dtype=np.uint8).reshape(len(lines), width)
 
-def part_2():
-    """Solution for part 2."""
-    file_path = os.path.join(sys.path[0], 'input.txt')
-    lines = read_lines_from_file(file_path)
+def dilate(mask: np.ndarray) -> np.ndarray:
+    """Dilate a boolean mask with a 3x3 neighbourhood."""
+    padded = np.pad(mask, 1)
+    rows, cols = mask.shape
+    result = np.zeros_like(mask)
 
-    integers = [str(i) for i in range(10)]
-    numbers_and_indices = get_numbers_and_indices(lines, integers)
+    for dr in range(3):
+        for dc in range(3):
+            result |= padded[dr:dr + rows, dc:dc + cols]
 
-    gears = []
+    return result
 
-    for height_index, line in enumerate(lines):
-        for width_index, item in enumerate(line):
-            if item == '*':
-                indices = get_surrounding_indices(lines, row=height_index, col=width_index)
+def label_numbers(grid: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Label the horizontal digit runs of a grid.
+
+    Returns a grid holding the run label (1, 2, ...) of every digit cell and 0 elsewhere,
+    together with an array of run values indexed by label (values[0] is 0).
+    """
+    digits = (grid >= ord('0')) & (grid <= ord('9'))
+    previous_digit = np.zeros_like(digits)
+    previous_digit[:, 1:] = digits[:, :-1]
+    next_digit = np.zeros_like(digits)
+    next_digit[:, :-1] = digits[:, 1:]
+
+    starts = digits & ~previous_digit
+    labels = np.cumsum(starts.ravel()).reshape(grid.shape) * digits
+
+    positions = np.flatnonzero(digits.ravel())
+    ids = labels.ravel()[positions]
+    run_ends = np.flatnonzero((digits & ~next_digit).ravel())
+    exponents = run_ends[ids - 1] - positions
+
+    values = np.zeros(int(starts.sum()) + 1, dtype=np.int64)
+    digit_values = grid.ravel()[positions].astype(np.int64) - ord('0')
+    np.add.at(values, ids, digit_values * np.power(10, exponents, dtype=np.int64))
 
-                arr = [item for index in indices for item in numbers_and_indices if index in item['indices']]
-                arr = remove_duplicates(arr)
+    return labels, values
 
-                if len(arr) == 2:
-                    gears.append(arr)
+def get_part_number_sum(grid: np.ndarray) -> int:
+    """Sum the numbers adjacent to at least one symbol."""
+    labels, values = label_numbers(grid)
+    symbols = (labels == 0) & (grid != ord('.'))
 
-    gears = [np.prod([int(item['number']) for item in gear_element]) for gear_element in gears]
-    answer = sum(gears)
+    part_ids = np.unique(labels[dilate(symbols) & (labels > 0)])
+    return int(values[part_ids].sum())
 
-    print(f'Answer part 2: {answer}')
+def get_gear_ratio_sum(grid: np.ndarray) -> int:
+    """Sum the products of the two numbers adjacent to every '*' that touches exactly two numbers."""
+    labels, values = label_numbers(grid)
+    padded = np.pad(labels, 1)
+    rows, cols = np.nonzero(grid == ord('*'))
+
+    neighbours = np.stack([padded[rows + dr, cols + dc] for dr in range(3) for dc in range(3)], axis=1)
+    neighbours.sort(axis=1)
+
+    previous = np.zeros_like(neighbours)
+    previous[:, 1:] = neighbours[:, :-1]
+    distinct = (neighbours > 0) & (neighbours != previous)
+
+    gears = distinct.sum(axis=1) == 2
+    ratios = np.where(distinct, values[neighbours], 1).prod(axis=1)
+
+    return int(ratios[gears].sum())
+
+def get_number_spans(line: str) -> List[Tuple[int, int, int]]:
+    """Get the (start, end, value) of every number in a line, with end exclusive."""
+    return [(match.start(), match.end(), int(match.group())) for match in NUMBER_PATTERN.finditer(line)]
+
+def process_row(window: Deque[Tuple[str, List[Tuple[int, int, int]]]]) -> Iterator[Tuple[str, int]]:
+    """Yield the part numbers and gear ratios of the middle row of a three-row window."""
+    (_, _), (line, spans), (_, _) = window
+
+    for start, end, value in spans:
+        if any(SYMBOL_PATTERN.search(row_line, max(0, start - 1), end + 1) for row_line, _ in window):
+            yield 'part', value
+
+    for col, item in enumerate(line):
+        if item == '*':
+            adjacent = [value for _, row_spans in window for start, end, value in row_spans
+                        if start <= col + 1 and end >= col]
+
+            if len(adjacent) == 2:
+                yield 'gear', adjacent[0] * adjacent[1]
+
+def stream_schematic(file_path: str) -> Iterator[Tuple[str, int]]:
+    """
+    Read a schematic row by row, holding only three rows at a time.
+
+    Yields ('part', number) for every part number and ('gear', ratio) for every gear.
+    """
+    empty_row = ('', [])
+    window = deque([empty_row], maxlen=3)
+
+    with open(file_path, 'r') as file:
+        for line in file:
+            line = line.strip()
+            window.append((line, get_number_spans(line)))
+
+            if len(window) == 3:
+                yield from process_row(window)
+
+    window.append(empty_row)
+    if len(window) == 3:
+        yield from process_row(window)
+
+def solve_streaming(file_path: str) -> Tuple[int, int]:
+    """Compute the answers of both parts in a single streaming pass."""
+    totals = {'part': 0, 'gear': 0}
+
+    for kind, value in stream_schematic(file_path):
+        totals[kind] += value
+
+    return totals['part'], totals['gear']
+
+def parse_input(file_path: str) -> np.ndarray:
+    """Read the input file into a schematic grid."""
+    return load_grid(read_lines_from_file(file_path))
+
+def part_1(grid: np.ndarray) -> int:
+    """Solution for part 1."""
+    return get_part_number_sum(grid)
+
+def part_2(grid: np.ndarray) -> int:
+    """Solution for part 2."""
+    return get_gear_ratio_sum(grid)
 
 if __name__ == "__main__":
-    part_1()
-    part_2()
\ No newline at end of file
+    file_path = os.path.join(sys.path[0], 'input.txt')
+    grid = parse_input(file_path)
+
+    print(f'Answer part 1: {part_1(grid)}')
+    print(f'Answer part 2: {part_2(grid)}')
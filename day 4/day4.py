@@ -1,6 +1,10 @@
 import os
+import struct
 import sys
-from typing import List, Tuple, Dict
+from array import array
+from typing import List, Optional, Sequence, Tuple
+
+PARSER_VERSION = 1
 
 def read_lines_from_file(file_path: str) -> List[str]:
     """
@@ -15,93 +19,271 @@ def read_lines_from_file(file_path: str) -> List[str]:
     with open(file_path, 'r') as file:
         return [line.strip() for line in file.readlines()]
 
-def get_price(intersection: List[str]) -> int:
+def get_price(matches: int) -> int:
     """
-    Calculate the price based on the length of the intersection of winning and owned cards.
+    Calculate the price based on the number of winning numbers owned.
 
     Parameters:
-        intersection (List[str]): List of common elements between winning and owned cards.
+        matches (int): Number of common elements between winning and owned cards.
 
     Returns:
         int: Calculated price.
     """
-    length = len(intersection)
-    
-    if length == 1:
-        return 1
+    if matches == 0:
+        return 0
     
     else:
-        return int(2**(length-1))
+        return 1 << (matches - 1)
 
-def part_1(lines: List[str]) -> None:
+def get_bitmask(numbers: str) -> int:
     """
-    Calculate and print the answer for Part 1.
+    Encode a space separated list of numbers as an integer bitmask.
 
     Parameters:
-        lines (List[str]): List of input lines containing winning and owned cards information.
+        numbers (str): Numbers separated by one or more spaces.
+
+    Returns:
+        int: Bitmask with bit n set for every number n in the list.
     """
-    count = 0
+    mask = 0
+    for item in numbers.split():
+        mask |= 1 << int(item)
 
-    for line in lines:
-        winning_cards, owned_cards = line.split(' | ')
-        winning_cards = winning_cards.split(': ')[1]
-        winning_cards = [item for item in winning_cards.split(' ') if item]
-        owned_cards = [item for item in owned_cards.split(' ') if item]
-        intersection = list(set(winning_cards) & set(owned_cards))
-        count += get_price(intersection)
-        
-    print(f'Answer part 1: {count}')
+    return mask
 
-def get_intersection(card: Dict[str, any]) -> List[str]:
+def parse_card(line: str) -> Tuple[int, int]:
     """
-    Get the intersection of winning and owned numbers for a given card.
+    Parse a card into bitmasks of its winning and owned numbers.
 
     Parameters:
-        card (Dict[str, any]): Dictionary containing information about a card.
+        line (str): Input line containing winning and owned cards information.
 
     Returns:
-        List[str]: List of common elements between winning and owned numbers.
+        Tuple[int, int]: Winning numbers bitmask and owned numbers bitmask.
     """
-    winning_numbers = card['winning_numbers']
-    owned_numbers = card['owned_numbers']
-    intersection = [i for i in winning_numbers if i in owned_numbers]
-    return intersection
+    winning_numbers, owned_numbers = line.split(' | ')
+    winning_numbers = winning_numbers.split(': ')[1]
+    return get_bitmask(winning_numbers), get_bitmask(owned_numbers)
 
-def part_2(lines: List[str]) -> None:
+def get_match_counts(lines: List[str]) -> List[int]:
     """
-    Calculate and print the answer for Part 2.
+    Get the number of winning numbers owned on each card.
 
     Parameters:
         lines (List[str]): List of input lines containing winning and owned cards information.
+
+    Returns:
+        List[int]: Match count for each card, in input order.
     """
-    cards = {}
+    match_counts = []
 
-    # Make cards object
     for line in lines:
-        winning_numbers, owned_numbers = line.split(' | ')
-        id, winning_numbers = winning_numbers.split(': ')
-        id = id.split(' ')[-1]
-        winning_numbers = [item for item in winning_numbers.split(' ') if item]
-        owned_numbers = [item for item in owned_numbers.split(' ') if item]
-        cards[id] = {'amount': 1, 'winning_numbers': winning_numbers, 'owned_numbers': owned_numbers}
-        
-    for id, card in cards.items():
-        intersection = get_intersection(card)
-        cards_new_ids = [str(i) for i in list(range(int(id)+1, int(id)+1+len(intersection)))]
-
-        for id_new in cards_new_ids:
-            if id_new in cards.keys():
-                cards[id_new]['amount'] = cards[id_new]['amount'] + cards[id]['amount']
-    
-    answer = sum([card['amount'] for _, card in cards.items()])
-    
-    print(f'Answer part 2: {answer}')
+        winning_mask, owned_mask = parse_card(line)
+        match_counts.append((winning_mask & owned_mask).bit_count())
+
+    return match_counts
+
+class CardTable:
+    """
+    Parsed scratchcards, stored as an array of match counts in input order.
+
+    The table can be written to and read from a compact binary file, so repeat runs
+    can skip parsing the text input.
+    """
+
+    __slots__ = ('match_counts',)
+
+    MAGIC = b'AOC4'
+    HEADER = struct.Struct('<4sqqQ')
+
+    def __init__(self, match_counts: Sequence[int]):
+        self.match_counts = array('H', match_counts)
+
+    def __len__(self) -> int:
+        return len(self.match_counts)
+
+    @classmethod
+    def from_lines(cls, lines: List[str]) -> 'CardTable':
+        """Build the table from input lines."""
+        return cls(get_match_counts(lines))
+
+    def save(self, file_path: str, source_size: int, source_mtime_ns: int) -> None:
+        """Write the table to a binary file, tagged with the size and mtime of its source."""
+        match_counts = array('H', self.match_counts)
+        if sys.byteorder != 'little':
+            match_counts.byteswap()
+
+        with open(file_path, 'wb') as file:
+            file.write(self.HEADER.pack(self.MAGIC, source_size, source_mtime_ns, len(match_counts)))
+            file.write(match_counts.tobytes())
+
+    @classmethod
+    def load(cls, file_path: str, source_size: int, source_mtime_ns: int) -> Optional['CardTable']:
+        """Read a table from a binary file, or return None if it is missing, corrupt or stale."""
+        try:
+            with open(file_path, 'rb') as file:
+                header = file.read(cls.HEADER.size)
+                data = file.read()
+        except OSError:
+            return None
+
+        if len(header) != cls.HEADER.size:
+            return None
+
+        magic, size, mtime_ns, count = cls.HEADER.unpack(header)
+        if magic != cls.MAGIC or size != source_size or mtime_ns != source_mtime_ns or len(data) != 2 * count:
+            return None
+
+        match_counts = array('H')
+        match_counts.frombytes(data)
+        if sys.byteorder != 'little':
+            match_counts.byteswap()
+
+        table = cls.__new__(cls)
+        table.match_counts = match_counts
+        return table
+
+def load_card_table(file_path: str) -> CardTable:
+    """
+    Load the card table for an input file, using the binary cache next to it when it is up to date.
+
+    Parameters:
+        file_path (str): The path to the input file.
+
+    Returns:
+        CardTable: The parsed cards.
+    """
+    cache_path = file_path + '.cards'
+    stat = os.stat(file_path)
+
+    table = CardTable.load(cache_path, stat.st_size, stat.st_mtime_ns)
+    if table is None:
+        table = CardTable.from_lines(read_lines_from_file(file_path))
+        try:
+            table.save(cache_path, stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            pass
+
+    return table
+
+def stream_card_total(file_path: str) -> int:
+    """
+    Count the total number of cards, reading the cards one line at a time.
+
+    A card only affects the next `matches` cards, and `matches` is at most the number of
+    winning numbers on the card. The copy difference array is therefore kept in a ring
+    buffer with one slot more than the widest winning list seen so far, so memory does not
+    grow with the number of cards.
+
+    Parameters:
+        file_path (str): The path to the input file.
+
+    Returns:
+        int: Total number of cards.
+    """
+    ring = [0]
+    head = 0
+    running = 0
+    total = 0
+
+    with open(file_path, 'r') as file:
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+
+            winning_mask, owned_mask = parse_card(line)
+
+            size = winning_mask.bit_count() + 1
+            if size > len(ring):
+                ring = [ring[(head + offset) % len(ring)] for offset in range(len(ring))] + [0] * (size - len(ring))
+                head = 0
+
+            running += ring[head]
+            ring[head] = 0
+            copies = 1 + running
+            total += copies
+
+            matches = (winning_mask & owned_mask).bit_count()
+            if matches:
+                ring[(head + 1) % len(ring)] += copies
+                ring[(head + 1 + matches) % len(ring)] -= copies
+
+            head = (head + 1) % len(ring)
+
+    return total
+
+def parse_input(file_path: str) -> CardTable:
+    """
+    Read and parse the input file into a card table.
+
+    Parameters:
+        file_path (str): The path to the input file.
+
+    Returns:
+        CardTable: The parsed cards.
+    """
+    return CardTable.from_lines(read_lines_from_file(file_path))
+
+def part_1(table: CardTable) -> int:
+    """
+    Calculate the answer for Part 1.
+
+    Parameters:
+        table (CardTable): The parsed cards.
+
+    Returns:
+        int: Total price of all cards.
+    """
+    return sum(get_price(matches) for matches in table.match_counts)
+
+def count_cards(match_counts: Sequence[int]) -> int:
+    """
+    Count the total number of cards after all copies have been won.
+
+    Each card adds one copy of itself to the next `matches` cards for every copy held, so
+    the copies are spread with a difference array and a running prefix sum. Counts are
+    Python ints, so they cannot overflow.
+
+    Parameters:
+        match_counts (Sequence[int]): Match count for each card, in input order.
+
+    Returns:
+        int: Total number of cards.
+    """
+    n = len(match_counts)
+    difference = [0] * (n + 1)
+    running = 0
+    total = 0
+
+    for index, matches in enumerate(match_counts):
+        running += difference[index]
+        copies = 1 + running
+        total += copies
+
+        if matches:
+            difference[index + 1] += copies
+            difference[min(n, index + 1 + matches)] -= copies
+
+    return total
+
+def part_2(table: CardTable) -> int:
+    """
+    Calculate the answer for Part 2.
+
+    Parameters:
+        table (CardTable): The parsed cards.
+
+    Returns:
+        int: Total number of cards.
+    """
+    return count_cards(table.match_counts)
 
 if __name__ == "__main__":
     # Specify the path to the input file
     file_path = os.path.join(sys.path[0], 'input.txt')
 
-    lines = read_lines_from_file(file_path)
+    table = load_card_table(file_path)
 
-    part_1(lines)
-    part_2(lines)
\ No newline at end of file
+    print(f'Answer part 1: {part_1(table)}')
+    print(f'Answer part 2: {part_2(table)}')
\ No newline at end of file
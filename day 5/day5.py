@@ -1,9 +1,25 @@
 import os
 import sys
-from typing import List, Tuple
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import Value
+from multiprocessing.sharedctypes import Synchronized
+from typing import Iterator, List, Optional, Tuple
 
 import numpy as np
 
+# Upper bound (exclusive) of the numbers a mapping is defined on
+MAX_NUMBER = 2**63 - 1
+
+# Parallel location search: locations per block, blocks per worker in each wave, and how
+# often (in locations) a worker checks whether another worker has already done better
+SEARCH_BLOCK_SIZE = 100_000
+SEARCH_WAVE_BLOCKS = 4
+SEARCH_CHECK_INTERVAL = 1024
+
+PARSER_VERSION = 1
+
 def read_lines_from_file(file_path: str) -> List[str]:
     """
     Read lines from a file and return a list of strings.
@@ -17,7 +33,60 @@ def read_lines_from_file(file_path: str) -> List[str]:
     with open(file_path, 'r') as file:
         return [line.strip('\n') for line in file.readlines()]
 
-def get_data(lines: List[str]) -> List[List[List[int]]]:
+class CompiledMap:
+    """
+    A mapping stored as sorted boundary arrays with a forward and an inverse index.
+
+    Lookups use binary search over the sorted range starts instead of scanning the
+    raw [destination, source, length] triples.
+    """
+
+    __slots__ = ('source_starts', 'source_ends', 'source_offsets',
+                 'destination_starts', 'destination_ends', 'destination_offsets')
+
+    def __init__(self, triples: List[Tuple[int, int, int]]):
+        forward = sorted((source, source + length, destination - source)
+                         for destination, source, length in triples if length > 0)
+        inverse = sorted((destination, destination + length, source - destination)
+                         for destination, source, length in triples if length > 0)
+
+        self.source_starts = array('q', [item[0] for item in forward])
+        self.source_ends = array('q', [item[1] for item in forward])
+        self.source_offsets = array('q', [item[2] for item in forward])
+        self.destination_starts = array('q', [item[0] for item in inverse])
+        self.destination_ends = array('q', [item[1] for item in inverse])
+        self.destination_offsets = array('q', [item[2] for item in inverse])
+
+    def __len__(self) -> int:
+        return len(self.source_starts)
+
+    def __iter__(self) -> Iterator[Tuple[int, int, int]]:
+        """Yield the (destination, source, length) triples sorted by source."""
+        for start, end, offset in zip(self.source_starts, self.source_ends, self.source_offsets):
+            yield start + offset, start, end - start
+
+    def __repr__(self) -> str:
+        return f'CompiledMap({list(self)})'
+
+    def forward(self, number: int) -> int:
+        """Map a source number to its destination."""
+        index = bisect_right(self.source_starts, number) - 1
+
+        if index >= 0 and number < self.source_ends[index]:
+            return number + self.source_offsets[index]
+
+        return number
+
+    def inverse(self, number: int) -> int:
+        """Map a destination number back to its source."""
+        index = bisect_right(self.destination_starts, number) - 1
+
+        if index >= 0 and number < self.destination_ends[index]:
+            return number + self.destination_offsets[index]
+
+        return number
+
+def get_data(lines: List[str]) -> List[CompiledMap]:
     """
     Process lines from input and extract data.
 
@@ -25,7 +94,7 @@ def get_data(lines: List[str]) -> List[List[List[int]]]:
     - lines (List[str]): List of strings representing lines from the input.
 
     Returns:
-    - List[List[List[int]]]: A list of lists of lists of integers representing the data.
+    - List[CompiledMap]: The compiled mappings, one per stage.
     """
     arr_arr = []
     arr = []
@@ -41,53 +110,41 @@ def get_data(lines: List[str]) -> List[List[List[int]]]:
     arr_arr = [arr[1:] for arr in arr_arr]
     arr_arr = [[[int(i) for i in item.split(' ')] for item in arr] for arr in arr_arr]
     
-    return arr_arr
+    return [CompiledMap(arr) for arr in arr_arr]
 
-def mapping(number: int, map_one: List[Tuple[int, int, int]]) -> int:
+def mapping(number: int, map_one: CompiledMap) -> int:
     """
     Apply mapping to a number using a given mapping.
 
     Parameters:
     - number (int): The input number.
-    - map_one (List[Tuple[int, int, int]]): The mapping to apply.
+    - map_one (CompiledMap): The mapping to apply.
 
     Returns:
     - int: The mapped number.
     """
-    for trans in map_one:
-        if trans[1] <= number < trans[1] + trans[2]:
-            index = number - trans[1]
-            number_new = trans[0] + index
-            return number_new
-    
-    return number
+    return map_one.forward(number)
 
-def mapping_inverse(number: int, map_one: List[Tuple[int, int, int]]) -> int:
+def mapping_inverse(number: int, map_one: CompiledMap) -> int:
     """
     Apply inverse mapping to a number using a given inverse mapping.
 
     Parameters:
     - number (int): The input number.
-    - map_one (List[Tuple[int, int, int]]): The inverse mapping to apply.
+    - map_one (CompiledMap): The inverse mapping to apply.
 
     Returns:
     - int: The mapped number.
     """
-    for trans in map_one:
-        if trans[0] <= number < trans[0] + trans[2]:
-            index = number - trans[0]
-            number_new = trans[1] + index
-            return number_new
-    
-    return number
+    return map_one.inverse(number)
 
-def get_complete_mapping_inverse(number: int, maps: List[List[Tuple[int, int, int]]]) -> int:
+def get_complete_mapping_inverse(number: int, maps: List[CompiledMap]) -> int:
     """
     Apply complete inverse mapping to a number using a list of inverse mappings.
 
     Parameters:
     - number (int): The input number.
-    - maps (List[List[Tuple[int, int, int]]]): List of inverse mappings.
+    - maps (List[CompiledMap]): List of inverse mappings.
 
     Returns:
     - int: The mapped number.
@@ -97,13 +154,13 @@ def get_complete_mapping_inverse(number: int, maps: List[List[Tuple[int, int, in
     
     return number
 
-def get_complete_map(number: int, maps: List[List[Tuple[int, int, int]]]) -> int:
+def get_complete_map(number: int, maps: List[CompiledMap]) -> int:
     """
     Apply complete mapping to a number using a list of mappings.
 
     Parameters:
     - number (int): The input number.
-    - maps (List[List[Tuple[int, int, int]]]): List of mappings.
+    - maps (List[CompiledMap]): List of mappings.
 
     Returns:
     - int: The mapped number.
@@ -113,62 +170,302 @@ def get_complete_map(number: int, maps: List[List[Tuple[int, int, int]]]) -> int
     
     return number
 
-def part_1():
-    # Specify the path to the input file
-    file_path = os.path.join(sys.path[0], 'input.txt')
+def mapping_batch(numbers: np.ndarray, map_one: CompiledMap) -> np.ndarray:
+    """
+    Apply mapping to an array of numbers at once.
+
+    Parameters:
+    - numbers (np.ndarray): The input numbers as an int64 array.
+    - map_one (CompiledMap): The mapping to apply.
+
+    Returns:
+    - np.ndarray: The mapped numbers.
+    """
+    if len(map_one) == 0:
+        return numbers.copy()
+
+    starts = np.frombuffer(map_one.source_starts, dtype=np.int64)
+    ends = np.frombuffer(map_one.source_ends, dtype=np.int64)
+    offsets = np.frombuffer(map_one.source_offsets, dtype=np.int64)
+
+    index = np.searchsorted(starts, numbers, side='right') - 1
+    clipped = np.maximum(index, 0)
+    inside = (index >= 0) & (numbers < ends[clipped])
+
+    return numbers + np.where(inside, offsets[clipped], 0)
+
+def get_complete_map_batch(numbers: np.ndarray, maps: List[CompiledMap], progress: bool = False) -> np.ndarray:
+    """
+    Apply complete mapping to an array of numbers using a list of mappings.
 
+    Parameters:
+    - numbers (np.ndarray): The input numbers.
+    - maps (List[CompiledMap]): List of mappings.
+    - progress (bool): Print a progress line after each stage.
+
+    Returns:
+    - np.ndarray: The mapped numbers as an int64 array.
+    """
+    numbers = np.asarray(numbers, dtype=np.int64)
+
+    for index, map_one in enumerate(maps):
+        numbers = mapping_batch(numbers, map_one)
+
+        if progress:
+            print(f'Stage: {index + 1}/{len(maps)}', end='\r')
+
+    return numbers
+
+def parse_input(file_path: str) -> Tuple[List[int], List[CompiledMap]]:
+    """
+    Read and parse the input file.
+
+    Parameters:
+    - file_path (str): The path to the input file.
+
+    Returns:
+    - Tuple[List[int], List[CompiledMap]]: The seed numbers and the compiled mappings.
+    """
     lines = read_lines_from_file(file_path)
     seeds = [int(i) for i in lines[0].split(': ')[1].split(' ')]
-    maps = get_data(lines)
-    
-    final = []
-    for index, number in enumerate(seeds):
-        final.append(get_complete_map(number, maps))
-        
-        percentage = np.round((index + 1) / len(seeds) * 100, 2)
-        print(f'Percentage: {percentage} %', end='\r')
-        
-    answer = min(final)
-    print(f'Answer part 1: {answer}')
+
+    return seeds, get_data(lines)
+
+def part_1(almanac: Tuple[List[int], List[CompiledMap]]) -> int:
+    """Solution for part 1: the lowest location of any of the seeds."""
+    seeds, maps = almanac
+    composed_map = compose_maps(maps)
+
+    return int(get_complete_map_batch(np.array(seeds, dtype=np.int64), [composed_map]).min())
+
+def sort_bounds(bounds_arr: List[List[int]]) -> List[List[int]]:
+    """
+    Sort bounds by their start and merge the ones that overlap or touch.
+
+    Parameters:
+    - bounds_arr (List[List[int]]): List of half-open bounds.
+
+    Returns:
+    - List[List[int]]: Sorted, non-overlapping bounds covering the same numbers.
+    """
+    merged = []
+
+    for start, end in sorted(bounds for bounds in bounds_arr if bounds[0] < bounds[1]):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+
+    return merged
 
 def is_in_bounds(bounds_arr: List[List[int]], number: int) -> bool:
     """
     Check if a number is within the given bounds.
 
     Parameters:
-    - bounds_arr (List[List[int]]): List of bounds.
+    - bounds_arr (List[List[int]]): List of bounds, sorted and non-overlapping (see sort_bounds).
     - number (int): The number to check.
 
     Returns:
     - bool: True if the number is within bounds, False otherwise.
     """
-    for bounds in bounds_arr:
-        if bounds[0] <= number < bounds[1]:
-            return True
-            
-    return False
+    index = bisect_right(bounds_arr, number, key=lambda bounds: bounds[0]) - 1
 
-def part_2():
-    # Specify the path to the input file
-    file_path = os.path.join(sys.path[0], 'input.txt')
+    return index >= 0 and number < bounds_arr[index][1]
 
-    lines = read_lines_from_file(file_path)
-    seeds = [int(i) for i in lines[0].split(': ')[1].split(' ')]
+# State of a search worker process, set by init_search
+search_state = {}
+
+def init_search(best: Synchronized, maps_inverse: List[CompiledMap], bounds_arr: List[List[int]]) -> None:
+    """Store the shared best location, the inverse mappings and the seed bounds in a search worker."""
+    search_state['best'] = best
+    search_state['maps_inverse'] = maps_inverse
+    search_state['bounds_arr'] = bounds_arr
+
+def search_block(start: int, end: int) -> Optional[int]:
+    """
+    Find the lowest location in [start, end) that maps back to a seed, inside a search worker.
+
+    The block is abandoned as soon as another worker has published a location at or below
+    the number being checked.
+
+    Parameters:
+    - start (int): The first location of the block.
+    - end (int): One past the last location of the block.
+
+    Returns:
+    - Optional[int]: The lowest location found, or None.
+    """
+    best = search_state['best']
+    maps_inverse = search_state['maps_inverse']
+    bounds_arr = search_state['bounds_arr']
+
+    for number in range(start, end):
+        if number % SEARCH_CHECK_INTERVAL == 0 and number >= best.value:
+            return None
+
+        if is_in_bounds(bounds_arr, get_complete_mapping_inverse(number, maps_inverse)):
+            with best.get_lock():
+                if number < best.value:
+                    best.value = number
+
+            return number
+
+    return None
+
+def find_lowest_location_parallel(bounds_arr: List[List[int]], maps: List[CompiledMap], workers: Optional[int] = None,
+                                  block_size: int = SEARCH_BLOCK_SIZE) -> int:
+    """
+    Get the lowest location reachable from any of the seed ranges by searching locations upward in parallel.
+
+    The location space is split into blocks that are searched by a process pool, one wave
+    of blocks at a time. Workers publish the best location found so far in shared memory,
+    so blocks above it are skipped or abandoned. The location of the first seed is used as
+    the initial best, which bounds the search.
+
+    Parameters:
+    - bounds_arr (List[List[int]]): List of half-open seed ranges.
+    - maps (List[CompiledMap]): List of mappings.
+    - workers (Optional[int]): Number of worker processes, defaults to the number of CPUs.
+    - block_size (int): Number of locations per block.
+
+    Returns:
+    - int: The lowest location.
+    """
+    bounds_arr = sort_bounds(bounds_arr)
+    if not bounds_arr:
+        raise ValueError('No seed ranges to search')
+
+    workers = workers or os.cpu_count() or 1
+    best = Value('q', get_complete_map(bounds_arr[0][0], maps))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_search,
+                             initargs=(best, maps[::-1], bounds_arr)) as executor:
+        start = 0
+        while start < best.value:
+            wave_end = min(best.value, start + SEARCH_WAVE_BLOCKS * workers * block_size)
+            futures = [executor.submit(search_block, block_start, min(block_start + block_size, wave_end))
+                       for block_start in range(start, wave_end, block_size)]
+            wait(futures)
+
+            for future in futures:
+                future.result()
+
+            start = wave_end
+
+    return best.value
+
+def split_range(start: int, end: int, map_one: CompiledMap) -> List[Tuple[int, int, int]]:
+    """
+    Split a half-open range at the source boundaries of a mapping.
+
+    Parameters:
+    - start (int): The first number of the range.
+    - end (int): One past the last number of the range.
+    - map_one (CompiledMap): The mapping to split against.
+
+    Returns:
+    - List[Tuple[int, int, int]]: Pieces (start, end, offset) covering the range, where offset
+      is the value added by the mapping (0 for numbers that are not mapped).
+    """
+    pieces = []
+    index = max(0, bisect_right(map_one.source_starts, start) - 1)
+
+    while index < len(map_one) and start < end:
+        source = map_one.source_starts[index]
+        source_end = map_one.source_ends[index]
+
+        if source >= end:
+            break
+
+        if source_end > start:
+            if start < source:
+                pieces.append((start, source, 0))
+                start = source
+
+            stop = min(end, source_end)
+            pieces.append((start, stop, map_one.source_offsets[index]))
+            start = stop
+
+        index += 1
+
+    if start < end:
+        pieces.append((start, end, 0))
+
+    return pieces
+
+def map_ranges(ranges: List[Tuple[int, int]], map_one: CompiledMap) -> List[Tuple[int, int]]:
+    """
+    Apply mapping to a list of half-open ranges.
+
+    Parameters:
+    - ranges (List[Tuple[int, int]]): The input ranges.
+    - map_one (CompiledMap): The mapping to apply.
+
+    Returns:
+    - List[Tuple[int, int]]: The mapped ranges.
+    """
+    return [(piece_start + offset, piece_end + offset)
+            for start, end in ranges
+            for piece_start, piece_end, offset in split_range(start, end, map_one)]
+
+def compose_maps(maps: List[CompiledMap]) -> CompiledMap:
+    """
+    Fold a chain of mappings into a single mapping from the first source to the last destination.
+
+    Parameters:
+    - maps (List[CompiledMap]): List of mappings, applied in order.
+
+    Returns:
+    - CompiledMap: The composed mapping. Adjacent pieces with the same offset are merged
+      and pieces that map numbers to themselves are left out.
+    """
+    # Pieces (start, end, offset) in terms of the first source, covering every number
+    pieces = [(0, MAX_NUMBER, 0)]
+
+    for map_one in maps:
+        pieces = [(piece_start - offset, piece_end - offset, offset + piece_offset)
+                  for start, end, offset in pieces
+                  for piece_start, piece_end, piece_offset in split_range(start + offset, end + offset, map_one)]
+
+    merged = []
+    for start, end, offset in pieces:
+        if merged and merged[-1][1] == start and merged[-1][2] == offset:
+            merged[-1] = (merged[-1][0], end, offset)
+        else:
+            merged.append((start, end, offset))
+
+    return CompiledMap([(start + offset, start, end - start) for start, end, offset in merged if offset != 0])
+
+def get_lowest_location(bounds_arr: List[List[int]], maps: List[CompiledMap]) -> int:
+    """
+    Get the lowest location reachable from any of the seed ranges.
+
+    Parameters:
+    - bounds_arr (List[List[int]]): List of half-open seed ranges.
+    - maps (List[CompiledMap]): List of mappings.
+
+    Returns:
+    - int: The lowest location.
+    """
+    ranges = [(bounds[0], bounds[1]) for bounds in bounds_arr if bounds[0] < bounds[1]]
+
+    for map_one in maps:
+        ranges = map_ranges(ranges, map_one)
+
+    return min(start for start, _ in ranges)
+
+def part_2(almanac: Tuple[List[int], List[CompiledMap]]) -> int:
+    """Solution for part 2: the lowest location of any seed in the seed ranges."""
+    seeds, maps = almanac
     bounds_arr = [[seeds[i], seeds[i] + seeds[i + 1]] for i in range(0, len(seeds), 2)]
-    maps = get_data(lines)
-    maps_inverse = maps[::-1]
-    
-    number_initial = 0
-    while True:
-        number_final = get_complete_mapping_inverse(number_initial, maps_inverse)
-        print(f'number_final: {number_final} \t\t number_initial: {number_initial}', end='\r')
 
-        if is_in_bounds(bounds_arr, number_final):
-            print(f'\n\nAnswer: {number_initial}')
-            exit()
-        
-        number_initial += 1
+    return get_lowest_location(bounds_arr, maps)
 
 if __name__ == "__main__":
-    part_1()
-    part_2()
\ No newline at end of file
+    # Specify the path to the input file
+    file_path = os.path.join(sys.path[0], 'input.txt')
+    almanac = parse_input(file_path)
+
+    print(f'Answer part 1: {part_1(almanac)}')
+    print(f'Answer part 2: {part_2(almanac)}')
\ No newline at end of file
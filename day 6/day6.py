@@ -1,8 +1,16 @@
+import math
 import os
 import sys
+from time import perf_counter
 from typing import List, Tuple
+
 import numpy as np
 
+# Largest race time for which time**2 fits in an int64
+MAX_BATCH_TIME = math.isqrt(np.iinfo(np.int64).max)
+
+PARSER_VERSION = 1
+
 def read_lines_from_file(file_path: str) -> List[str]:
     """
     Read lines from a file and return a list of strings.
@@ -16,64 +24,183 @@ def read_lines_from_file(file_path: str) -> List[str]:
     with open(file_path, 'r') as file:
         return [line.strip('\n') for line in file.readlines()]
 
-def get_upper_lower_bound(time: float, distance: float) -> Tuple[float, float]:
+def get_races(lines: List[str]) -> Tuple[List[int], List[int]]:
     """
-    Calculate upper and lower bounds based on time and distance.
+    Parse the race times and record distances.
 
     Parameters:
-    - time (float): The time value.
-    - distance (float): The distance value.
+    - lines (List[str]): Lines of the input file.
 
     Returns:
-    - Tuple[float, float]: Lower and upper bounds.
+    - Tuple[List[int], List[int]]: Times and distances of the races.
     """
-    upper_bound = 1/2 * (time + np.sqrt(time**2 - 4*distance))
-    lower_bound = 1/2 * (time - np.sqrt(time**2 - 4*distance))
-    
-    return lower_bound, upper_bound
+    times = [int(i) for i in lines[0].split(':')[1:][0].split(' ') if i]
+    distances = [int(i) for i in lines[1].split(':')[1:][0].split(' ') if i]
 
-def get_numbers_in_bound(lower_bound: float, upper_bound: float) -> List[int]:
+    return times, distances
+
+def get_kerned_race(lines: List[str]) -> Tuple[int, int]:
     """
-    Get numbers within a specified range.
+    Parse the single race obtained by ignoring the spaces between the numbers.
 
     Parameters:
-    - lower_bound (float): The lower bound.
-    - upper_bound (float): The upper bound.
+    - lines (List[str]): Lines of the input file.
 
     Returns:
-    - List[int]: List of numbers within the specified range.
+    - Tuple[int, int]: Time and distance of the race.
     """
-    return [i for i in range(int(lower_bound-1), int(upper_bound+1)) if i > lower_bound and i < upper_bound]
+    time = int(lines[0].split(':')[1].replace(' ', ''))
+    distance = int(lines[1].split(':')[1].replace(' ', ''))
 
-def part_1():
-    file_path = os.path.join(sys.path[0], 'input.txt')
+    return time, distance
 
-    lines = read_lines_from_file(file_path) 
-    
-    times = [int(i) for i in lines[0].split(':')[1:][0].split(' ') if i]
-    distances = [int(i) for i in lines[1].split(':')[1:][0].split(' ') if i]
+def count_ways_to_win(time: int, distance: int) -> int:
+    """
+    Count the hold times that beat the record distance, using exact integer arithmetic.
 
-    arr = []
-    for i in range(len(times)):
-        time = times[i]
-        distance = distances[i]
-    
-        lower_bound, upper_bound = get_upper_lower_bound(time, distance)
-        answer = get_numbers_in_bound(lower_bound, upper_bound)
-        
-        arr.append(len(answer))        
-    
-    print(f'Answer part 1: {np.prod(arr)}')
-    
-def part_2():
-    time = 48989083
-    distance = 390110311121360
+    Holding for h beats the record when h * (time - h) > distance. The bounds follow from
+    the roots of that quadratic, estimated with math.isqrt and then corrected by checking
+    the inequality directly.
+
+    Parameters:
+    - time (int): The race time.
+    - distance (int): The record distance.
+
+    Returns:
+    - int: Number of winning hold times.
+    """
+    discriminant = time * time - 4 * distance
+    if discriminant <= 0:
+        return 0
+
+    lower = max(0, (time - math.isqrt(discriminant)) // 2)
+
+    while lower > 0 and (lower - 1) * (time - lower + 1) > distance:
+        lower -= 1
+    while lower <= time // 2 and lower * (time - lower) <= distance:
+        lower += 1
+
+    # The winning hold times are symmetric around time / 2
+    upper = time - lower
+
+    return max(0, upper - lower + 1)
+
+def isqrt_batch(values: np.ndarray) -> np.ndarray:
+    """
+    Compute the exact integer square root of an array of non-negative int64 values.
+
+    Parameters:
+    - values (np.ndarray): The input values.
+
+    Returns:
+    - np.ndarray: The largest r with r * r <= value, for every value.
+    """
+    roots = np.minimum(np.sqrt(values.astype(np.float64)).astype(np.int64), MAX_BATCH_TIME)
+
+    # The float estimate can be off by one or two in either direction
+    while True:
+        too_big = roots * roots > values
+        if not too_big.any():
+            break
+        roots -= too_big
 
-    lower_bound, upper_bound = get_upper_lower_bound(time, distance)
-    answer = get_numbers_in_bound(lower_bound, upper_bound)
+    while True:
+        following = np.minimum(roots + 1, MAX_BATCH_TIME)
+        too_small = (roots < MAX_BATCH_TIME) & (following * following <= values)
+        if not too_small.any():
+            break
+        roots += too_small
+
+    return roots
+
+def count_ways_to_win_batch(times: np.ndarray, distances: np.ndarray) -> np.ndarray:
+    """
+    Count the winning hold times of many races at once.
+
+    Gives the same results as count_ways_to_win, using int64 arithmetic throughout.
+
+    Parameters:
+    - times (np.ndarray): The race times, between 0 and MAX_BATCH_TIME.
+    - distances (np.ndarray): The record distances, between 0 and times**2 / 4.
+
+    Returns:
+    - np.ndarray: Number of winning hold times of every race.
+    """
+    times = np.asarray(times, dtype=np.int64)
+    distances = np.asarray(distances, dtype=np.int64)
+
+    if times.size and (times.min() < 0 or times.max() > MAX_BATCH_TIME):
+        raise ValueError(f'Race times must be between 0 and {MAX_BATCH_TIME}')
+    if distances.size and (distances.min() < 0 or distances.max() > MAX_BATCH_TIME**2 // 4):
+        raise ValueError(f'Record distances must be between 0 and {MAX_BATCH_TIME**2 // 4}')
+
+    discriminants = times * times - 4 * distances
+    lower = np.maximum(0, (times - isqrt_batch(np.maximum(discriminants, 0))) // 2)
+
+    while True:
+        step_down = (lower > 0) & ((lower - 1) * (times - lower + 1) > distances)
+        if not step_down.any():
+            break
+        lower -= step_down
+
+    while True:
+        step_up = (lower <= times // 2) & (lower * (times - lower) <= distances)
+        if not step_up.any():
+            break
+        lower += step_up
+
+    return np.where(discriminants > 0, np.maximum(0, times - 2 * lower + 1), 0)
+
+def benchmark_races(n_races: int, seed: int = 0) -> Tuple[float, float]:
+    """
+    Compare the throughput of the batch solver with a loop over the scalar solver.
+
+    Parameters:
+    - n_races (int): Number of random races to evaluate.
+    - seed (int): Seed of the random generator.
+
+    Returns:
+    - Tuple[float, float]: Races per second of the scalar loop and of the batch solver.
+    """
+    rng = np.random.default_rng(seed)
+    times = rng.integers(1, 10**9, size=n_races, dtype=np.int64)
+    distances = (rng.random(n_races) * (times // 2) * (times - times // 2)).astype(np.int64)
+
+    start = perf_counter()
+    expected = [count_ways_to_win(race_time, distance) for race_time, distance in zip(times.tolist(), distances.tolist())]
+    scalar_rate = n_races / (perf_counter() - start)
+
+    start = perf_counter()
+    result = count_ways_to_win_batch(times, distances)
+    batch_rate = n_races / (perf_counter() - start)
+
+    assert result.tolist() == expected
+    print(f'Scalar: {scalar_rate:,.0f} races/s \t Batch: {batch_rate:,.0f} races/s')
+
+    return scalar_rate, batch_rate
+
+def parse_input(file_path: str) -> List[str]:
+    """Read and parse the input file."""
+    return read_lines_from_file(file_path)
+
+def part_1(lines: List[str]) -> int:
+    """Solution for part 1: the product of the number of ways to win each race."""
+    times, distances = get_races(lines)
+
+    return math.prod(count_ways_to_win(time, distance) for time, distance in zip(times, distances))
     
-    print(f'Answer part 2: {len(answer)}')
+def part_2(lines: List[str]) -> int:
+    """Solution for part 2: the number of ways to win the kerned race."""
+    time, distance = get_kerned_race(lines)
+
+    return count_ways_to_win(time, distance)
 
 if __name__ == "__main__":
-    part_1()
-    part_2()
\ No newline at end of file
+    file_path = os.path.join(sys.path[0], 'input.txt')
+    lines = parse_input(file_path)
+
+    print(f'Answer part 1: {part_1(lines)}')
+    print(f'Answer part 2: {part_2(lines)}')
+
+    if '--benchmark' in sys.argv:
+        benchmark_races(1_000_000)
\ No newline at end of file